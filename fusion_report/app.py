@@ -3,29 +3,58 @@
 import csv
 import json
 import os
+import re
 import sys
-import time
 from argparse import Namespace
 from collections import defaultdict
-from typing import Any, Dict, List
-
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from multiprocessing import get_context
+from typing import Any, Collection, Dict, Iterable, List, Tuple, Type
+
+from jinja2 import Environment
 from tqdm import tqdm
 
 from fusion_report.args_builder import ArgsBuilder
+from fusion_report.common.db import Db
 from fusion_report.common.exceptions.app import AppException
 from fusion_report.common.exceptions.db import DbException
 from fusion_report.common.exceptions.download import DownloadException
+from fusion_report.common.exceptions.report import ReportException
 from fusion_report.common.fusion_manager import FusionManager
+from fusion_report.common.json_stream import JsonStream
 from fusion_report.common.logger import Logger
 from fusion_report.common.models.fusion import Fusion
+from fusion_report.common.page import Page
 from fusion_report.common.report import Report
+from fusion_report.common.report_manifest import ReportManifest
+from fusion_report.common.report_writer import ArchiveWriter, ReportWriter
+from fusion_report.common.template import Template
+from fusion_report.config import Config
+from fusion_report.consolidate import Consolidate
+from fusion_report.data.annotations import AnnotationsDB
+from fusion_report.data.breakpoint_index import BreakpointIndex
 from fusion_report.data.cosmic import CosmicDB
+from fusion_report.data.fusion_annotations import FusionAnnotations
+from fusion_report.data.fusion_index import FusionIndex
 from fusion_report.data.fusiongdb2 import FusionGDB2
 from fusion_report.data.mitelman import MitelmanDB
 from fusion_report.download import Download
+from fusion_report.optimize import Optimize
 from fusion_report.settings import Settings
 from fusion_report.sync import Sync
 
+# delimiters of gene partners used by the tools and databases
+FUSION_DELIMITERS = re.compile(r"--|::|/")
+
+# pages: one page per fusion, spa: single page displaying fusions from a data file
+REPORT_LAYOUTS = ("pages", "spa")
+
 
 class App:
     """The class implements core methods.
@@ -33,14 +62,29 @@ class App:
     Attributes:
         manager: Fusion manager
         args: Parsed settings
+        known_fusions: Databases of known fusions keyed by canonical fusion key, loaded once
+            and shared by all samples
+        breakpoints: Index of COSMIC breakpoints, loaded once and shared by all samples
+        annotations: Annotations of fusions shown on fusion pages, cached and shared by all
+            samples
+        j2_env: Jinja2 Environment shared by reports of all samples
+        j2_variables: Extra variables from configuration shared by reports of all samples
     """
 
+    # app of the batch command, inherited by forked sample workers
+    _batch_app: "App | None" = None
+
     def __init__(self) -> None:
         try:
             self.args = ArgsBuilder()
             self.manager = FusionManager(self.args.supported_tools)
         except IOError as ex:
             raise AppException(ex) from ex
+        self.known_fusions: Dict[str, Tuple[str, ...]] | None = None
+        self.breakpoints: BreakpointIndex | None = None
+        self.annotations: FusionAnnotations | None = None
+        self.j2_env: Environment | None = None
+        self.j2_variables: Config | None = None
 
     def build_args(self):
         """Builds command-line arguments."""
@@ -56,27 +100,135 @@ class App:
         try:
             if params.command == "run":
                 Logger(__name__).info("Running application...")
-                self.preprocess(params)
-                self.generate_report(params)
-                self.export_results(params.output, params.export)
-                self.generate_multiqc(
-                    params.output,
-                    self.manager.fusions,
-                    params.sample,
-                    len(self.manager.running_tools),
-                )
-                self.generate_fusion_list(params.output, params.tool_cutoff)
+                self.run_sample(params)
+            elif params.command == "batch":
+                Logger(__name__).info("Running application for all samples...")
+                self.batch(params)
             elif params.command == "download":
                 Logger(__name__).info("Downloading resources...")
                 Download(params)
             elif params.command == "sync":
                 Logger(__name__).info("Synchronizing databases...")
                 Sync(params)
+            elif params.command == "db" and params.db_command == "optimize":
+                Logger(__name__).info("Optimizing databases...")
+                Optimize(params)
+            elif params.command == "db" and params.db_command == "consolidate":
+                Logger(__name__).info("Consolidating databases...")
+                Consolidate(params)
             else:
                 sys.exit(f"Command {params.command} not recognized!")
         except (AppException, DbException, DownloadException, IOError) as ex:
             raise AppException(ex) from ex
 
+    def run_sample(self, params: Namespace) -> None:
+        """Generate report and all result files of a single sample."""
+        self.manager = FusionManager(self.args.supported_tools)
+        self.preprocess(params)
+        self.generate_report(params)
+        self.export_results(params.output, params.export)
+        self.generate_multiqc(
+            params.output,
+            self.manager.iter_fusions(),
+            params.sample,
+            len(self.manager.running_tools),
+        )
+        self.generate_fusion_list(params.output, params.tool_cutoff)
+
+    def batch(self, params: Namespace) -> None:
+        """Run all samples of a samplesheet. Databases, templates and configuration are loaded
+        only once and shared by all samples. Samples are processed in forked processes
+        when `--parallel-samples` is higher than 1, database connections are closed before
+        forking and each worker connects again, see `Db.connection`.
+
+        Raises:
+            AppException
+        """
+        samples = self.read_samplesheet(params)
+        self.known_fusions = self.join_known_fusions(
+            self.load_local_fusions(params), params.match_reversed
+        )
+        if params.breakpoint_tolerance >= 0:
+            self.breakpoints = self.load_breakpoints(params)
+        self.annotations = self.load_annotations(params)
+        self.j2_env = Template.create_environment()
+        self.j2_variables = Config().parse(params.config)
+
+        if params.parallel_samples > 1 and len(samples) > 1:
+            Db.close_all()
+            App._batch_app = self
+            try:
+                with ProcessPoolExecutor(
+                    max_workers=min(params.parallel_samples, len(samples)),
+                    mp_context=get_context("fork"),
+                ) as pool:
+                    for sample in pool.map(self._run_batch_sample, samples):
+                        Logger(__name__).info("Sample %s finished", sample)
+            finally:
+                App._batch_app = None
+        else:
+            for sample in samples:
+                self.run_sample(sample)
+                Logger(__name__).info("Sample %s finished", sample.sample)
+
+    @staticmethod
+    def _run_batch_sample(params: Namespace) -> str:
+        """Worker of the batch command, runs a sample using the app inherited from the parent.
+
+        Raises:
+            AppException
+        """
+        if App._batch_app is None:
+            raise AppException("Batch worker was not forked from a running batch")
+        App._batch_app.run_sample(params)
+        return params.sample
+
+    def read_samplesheet(self, params: Namespace) -> List[Namespace]:
+        """Reads samplesheet of the batch command. Each row is turned into parameters of the run
+        command, the tool columns hold the tool outputs and empty cells are skipped.
+
+        Returns:
+            List of parameters, one per sample
+
+        Raises:
+            AppException
+        """
+        delimiter = "\t" if params.samplesheet.endswith((".tsv", ".txt")) else ","
+        samples: List[Namespace] = []
+        try:
+            with open(params.samplesheet, "r", encoding="utf-8", newline="") as samplesheet:
+                reader = csv.DictReader(samplesheet, delimiter=delimiter)
+                columns = [column.strip() for column in reader.fieldnames or []]
+                missing = [column for column in ("sample", "output") if column not in columns]
+                if missing:
+                    raise AppException(
+                        f"Samplesheet {params.samplesheet} is missing columns: "
+                        f"{', '.join(missing)}"
+                    )
+                for column in columns:
+                    if column not in ("sample", "output", *self.args.supported_tools):
+                        Logger(__name__).warning("Samplesheet column %s is ignored", column)
+
+                for row in reader:
+                    row = {key.strip(): (value or "").strip() for key, value in row.items() if key}
+                    if not row["sample"] or not row["output"]:
+                        raise AppException(
+                            f"Samplesheet line {reader.line_num} is missing sample or output"
+                        )
+                    sample = {**vars(params), "sample": row["sample"], "output": row["output"]}
+                    for tool in self.args.supported_tools:
+                        sample[tool] = row.get(tool) or None
+                    samples.append(Namespace(**sample))
+        except IOError as ex:
+            raise AppException(ex) from ex
+
+        names = [sample.sample for sample in samples]
+        outputs = [os.path.abspath(sample.output) for sample in samples]
+        if len(set(names)) != len(names) or len(set(outputs)) != len(outputs):
+            raise AppException("Samplesheet contains duplicate sample names or outputs")
+
+        return samples
+
     def preprocess(self, params: Namespace) -> None:
         """Parse, enrich and calculate Fusion Indication Index of the fusion."""
         self.parse_fusion_outputs(vars(params))
@@ -84,72 +236,402 @@ class App:
         self.score(params)
 
     def generate_report(self, params: Namespace) -> None:
-        """Generate fusion report with all pages."""
-        report = Report(params.config, params.output)
-        fusions = [
-            fusion for fusion in self.manager.fusions if len(fusion.tools) >= params.tool_cutoff
-        ]
+        """Generate fusion report with all pages. Pages are rendered and written by a pool of
+        `--threads` workers (default `Settings.THREAD_NUM`). With `spa` layout only the index
+        page is rendered, fusions are written to a single data file displayed by the index page.
+        With `--incremental` only pages whose inputs changed since the previous run are rendered,
+        see `ReportManifest`. Files of the report are written by `report_writer`.
 
-        index_page = report.create_page(
-            "Summary", filename="index.html", page_variables={"sample": params.sample}
-        )
-        index_page.add_module(
-            "index_summary", self.manager, params={"tool_cutoff": params.tool_cutoff}
-        )
-        report.render(index_page)
+        Raises:
+            AppException
+        """
+        if params.report_layout not in REPORT_LAYOUTS:
+            raise AppException(f"Report layout {params.report_layout} is not supported")
+        writer = self.report_writer(params)
+        try:
+            report = Report(
+                params.config,
+                params.output,
+                self.j2_env,
+                self.j2_variables,
+                params.assets,
+                params.hash_assets,
+                writer,
+                params.minify,
+            )
+            fusions = [
+                fusion
+                for fusion in self.manager.iter_fusions()
+                if len(fusion.tools) >= params.tool_cutoff
+            ]
+            # annotations of all fusions are fetched at once, not per page
+            if self.annotations is None:
+                self.annotations = self.load_annotations(params)
+            annotations = self.annotations.fetch(
+                [fusion.name for fusion in fusions if fusion.dbs], params.match_reversed
+            )
+
+            if params.incremental:
+                # date of unchanged pages is the date they were generated
+                report.manifest = ReportManifest(
+                    params.output,
+                    {
+                        "context": {k: v for k, v in report.context.items() if k != "date"},
+                        "sample": params.sample,
+                        "minify": params.minify,
+                        "compress": params.compress,
+                        "databases": FusionIndex.timestamp(params.db_path),
+                    },
+                )
+
+            index_page = report.create_page(
+                "Summary", filename="index.html", page_variables={"sample": params.sample}
+            )
+            index_page.add_module(
+                "index_summary",
+                self.manager,
+                params={
+                    "tool_cutoff": params.tool_cutoff,
+                    "report_layout": params.report_layout,
+                    "table_shard_size": params.table_shard_size,
+                    "output": params.output,
+                },
+            )
+            if params.table_shard_size > 0:
+                writer.add(Settings.TABLE_SHARDS)
 
-        with tqdm(total=len(fusions)) as pbar:
+            if params.report_layout == "spa":
+                self.generate_report_data(writer, fusions, annotations)
+                index_page.add_module("fusion_detail", params={"data_file": Settings.REPORT_DATA})
+                report.render(index_page)
+            else:
+                self.render_pages(report, index_page, fusions, annotations, params)
+            self.save_manifest(report, params)
+        finally:
+            writer.close()
+
+    def render_pages(
+        self,
+        report: Report,
+        index_page: Page,
+        fusions: List[Fusion],
+        annotations: Dict[str, Dict[str, Any]],
+        params: Namespace,
+    ) -> None:
+        """Renders index page and page of each fusion by a pool of workers. Pages are created
+        only when a worker is about to be free and dropped once written, at most
+        `2 * --threads` pages are held in memory regardless of the number of fusions."""
+        workers = params.threads or Settings.THREAD_NUM
+        with ThreadPoolExecutor(max_workers=workers) as pool, tqdm(total=len(fusions) + 1) as pbar:
+            pending: Dict[Future, str] = {pool.submit(report.render, index_page): "Summary"}
+            # pages are registered in order, modules are loaded and pages rendered by workers
             for fusion in fusions:
                 fusion_page = report.create_page(
                     fusion.name, page_variables={"sample": params.sample}
                 )
-                fusion_page.add_module("fusion_summary", params={"fusion": fusion})
-                report.render(fusion_page)
-                pbar.set_description(f"Processing {fusion.name}")
-                time.sleep(0.1)
-                pbar.update(1)
+                if report.manifest is not None and report.manifest.is_current(
+                    fusion_page.filename,
+                    report.manifest.digest(
+                        self.fusion_data(fusion, annotations.get(fusion.name, {}))
+                    ),
+                ):
+                    pbar.update(1)
+                    continue
+                pending[
+                    pool.submit(
+                        self.render_fusion_page,
+                        report,
+                        fusion_page,
+                        fusion,
+                        annotations.get(fusion.name, {}),
+                    )
+                ] = fusion.name
+                if len(pending) >= 2 * workers:
+                    self.collect_pages(
+                        pending, wait(pending, return_when=FIRST_COMPLETED).done, pbar
+                    )
+
+            self.collect_pages(pending, list(pending), pbar)
+
+    @staticmethod
+    def collect_pages(pending: Dict[Future, str], done: Iterable[Future], pbar: tqdm) -> None:
+        """Waits for the rendered pages and removes them from the pending pages."""
+        for future in done:
+            future.result()
+            pbar.set_description(f"Processing {pending.pop(future)}")
+            pbar.update(1)
+
+    @staticmethod
+    def report_writer(params: Namespace) -> ReportWriter:
+        """Returns writer of the report files: `--archive` streams them into a single archive,
+        otherwise they are written to the output directory with `--compress` siblings.
+
+        Raises:
+            AppException
+        """
+        compress = [value.strip() for value in params.compress.split(",") if value.strip()]
+        try:
+            if not params.archive:
+                return ReportWriter(params.output, compress)
+            if params.incremental or compress:
+                raise AppException("--archive can't be combined with --incremental or --compress")
+            return ArchiveWriter(params.output, params.archive, Settings.REPORT_ARCHIVE)
+        except ReportException as ex:
+            raise AppException(ex) from ex
+
+    @staticmethod
+    def save_manifest(report: Report, params: Namespace) -> None:
+        """Saves manifest of the incrementally regenerated report."""
+        if report.manifest is None:
+            return
+        deleted = report.manifest.save()
+        Logger(__name__).info(
+            "Report regenerated incrementally: %s pages rendered, %s kept, %s deleted",
+            len(report.manifest.pages) - len(report.manifest.kept),
+            len(report.manifest.kept),
+            len(deleted),
+        )
+
+    @staticmethod
+    def render_fusion_page(
+        report: Report, page: Page, fusion: Fusion, annotations: Dict[str, Any]
+    ) -> None:
+        """Loads summary of the fusion and renders its page."""
+        page.add_module("fusion_summary", params={"fusion": fusion, "annotations": annotations})
+        report.render(page)
+
+    @staticmethod
+    def fusion_data(fusion: Fusion, annotations: Dict[str, Any]) -> Dict[str, Any]:
+        """Returns data of the fusion displayed on its page."""
+        return {
+            "name": fusion.name,
+            "dbs": fusion.dbs,
+            "score": fusion.score,
+            "score_explained": fusion.score_explained,
+            "breakpoint_matches": fusion.breakpoint_matches,
+            "annotations": annotations,
+            "tools": dict(fusion.tools),
+        }
+
+    @staticmethod
+    def generate_report_data(
+        writer: ReportWriter, fusions: List[Fusion], annotations: Dict[str, Dict[str, Any]]
+    ) -> None:
+        """Writes fusions displayed by the single page report (`Settings.REPORT_DATA`), a script
+        assigning the data to `fusionReportData` so it can be loaded from local files.
+
+        Raises:
+            AppException
+        """
+        data: Dict[str, Any] = {
+            "fusions": [
+                App.fusion_data(fusion, annotations.get(fusion.name, {})) for fusion in fusions
+            ]
+        }
+        try:
+            writer.write(
+                Settings.REPORT_DATA,
+                f"window.fusionReportData = {json.dumps(data, separators=(',', ':'))};\n",
+            )
+        except ReportException as ex:
+            raise AppException(ex) from ex
 
     def parse_fusion_outputs(self, params: Dict[str, Any]) -> None:
-        """Executes parsing for each provided fusion detection tool."""
-        for param, value in params.items():
-            if param in self.manager.supported_tools and value:
-                # param: fusion tool
-                # value: fusion tool output
-                self.manager.parse(param, value, params["allow_multiple_gene_symbols"])
+        """Executes parsing for each provided fusion detection tool. Outputs are parsed one after
+        another unless `--threads` is higher than 1 or `--processes` is set."""
+        # param: fusion tool
+        # value: fusion tool output
+        outputs = [
+            (param, value)
+            for param, value in params.items()
+            if param in self.manager.supported_tools and value
+        ]
+        workers = params["threads"]
+        if params["processes"] and not workers:
+            workers = Settings.THREAD_NUM
+        self.manager.parse_all(
+            outputs, params["allow_multiple_gene_symbols"], workers, params["processes"]
+        )
 
     def enrich(self, params: Namespace) -> None:
-        """Enrich fusion with all relevant information from local databases."""
-        local_fusions: Dict[str, List[str]] = {}
+        """Enrich fusion with all relevant information from local databases. Fusions are joined
+        with the known fusions of the databases by their canonical key."""
+        if self.known_fusions is None:
+            self.known_fusions = self.join_known_fusions(
+                self.load_local_fusions(params), params.match_reversed
+            )
 
-        if not params.no_cosmic:
-            local_fusions.update(
-                {CosmicDB(params.db_path).name: CosmicDB(params.db_path).get_all_fusions()}
+        for fusion in self.manager.iter_fusions():
+            for db_name in self.known_fusions.get(
+                self.fusion_key(fusion.name, params.match_reversed), ()
+            ):
+                fusion.add_db(db_name)
+
+        if params.breakpoint_tolerance >= 0:
+            self.match_breakpoints(params)
+
+    def match_breakpoints(self, params: Namespace) -> None:
+        """Checks breakpoints reported by each tool against breakpoints catalogued in COSMIC.
+        Only events of the same gene pair, compared with `fusion_key`, count as a match."""
+        if self.breakpoints is None:
+            self.breakpoints = self.load_breakpoints(params)
+        if self.breakpoints is None:
+            return
+
+        for fusion in self.manager.iter_fusions():
+            key = self.fusion_key(fusion.name, params.match_reversed)
+            fusion.breakpoint_matches = [
+                tool
+                for tool, details in fusion.tools.items()
+                if any(
+                    self.fusion_key(event, params.match_reversed) == key
+                    for event in self.breakpoints.match(
+                        details.get("position"), params.breakpoint_tolerance
+                    )
+                )
+            ]
+
+    @staticmethod
+    def load_breakpoints(params: Namespace) -> BreakpointIndex | None:
+        """Loads index of COSMIC breakpoints.
+
+        Returns:
+            Index of breakpoints or None when COSMIC is not available
+        """
+        if params.no_cosmic or not os.path.exists(
+            os.path.join(params.db_path, f'{Settings.COSMIC["NAME"].lower()}.db')
+        ):
+            Logger(__name__).warning("COSMIC database not available, breakpoints are not checked")
+            return None
+
+        return BreakpointIndex.load(params.db_path, CosmicDB(params.db_path, readonly=True))
+
+    @classmethod
+    def join_known_fusions(
+        cls, local_fusions: Dict[str, Collection[str]], match_reversed: bool | None = None
+    ) -> Dict[str, Tuple[str, ...]]:
+        """Builds lookup table of known fusions for enrichment.
+
+        Returns:
+            Databases where the fusion was found, in order of `local_fusions`, keyed by
+            canonical fusion key
+        """
+        known_fusions: Dict[str, Tuple[str, ...]] = {}
+        for db_name, db_fusions in local_fusions.items():
+            for fusion in db_fusions:
+                key = cls.fusion_key(fusion, match_reversed)
+                dbs = known_fusions.get(key, ())
+                if db_name not in dbs:
+                    known_fusions[key] = dbs + (db_name,)
+
+        return known_fusions
+
+    @staticmethod
+    def fusion_key(fusion: str, match_reversed: bool | None = None) -> str:
+        """Returns canonical key of a fusion. Gene partners can be separated by `--`, `::` or `/`,
+        when `match_reversed` is set the partners are sorted so `A--B` matches `B--A`."""
+        partners = [partner.strip() for partner in FUSION_DELIMITERS.split(fusion)]
+        if match_reversed:
+            partners.sort()
+        return "--".join(partners)
+
+    @staticmethod
+    def load_local_fusions(params: Namespace) -> Dict[str, Collection[str]]:
+        """Loads all fusions of the enabled local databases. Fusions are read from consolidated
+        annotations database or the prebuilt index, databases are queried only when neither
+        is available or up to date.
+
+        Returns:
+            Fusions of each database keyed by database name
+        """
+        sources = App.local_databases(params)
+
+        # single query answering all databases
+        names = [settings["NAME"] for _, settings in sources]
+        annotations = App.annotations_database(params.db_path, names)
+        if annotations is not None:
+            return dict(annotations.get_all_fusions(names))
+
+        databases: List[Db] = [db_class(params.db_path, readonly=True) for db_class, _ in sources]
+        local_fusions: Dict[str, Collection[str]] | None = FusionIndex.load(
+            params.db_path, databases
+        )
+        if local_fusions is None:
+            Logger(__name__).info("Index of known fusions not found or outdated, using databases")
+            local_fusions = {database.name: database.get_all_fusions() for database in databases}
+
+        return local_fusions
+
+    @staticmethod
+    def load_annotations(params: Namespace) -> FusionAnnotations:
+        """Creates fetcher of fusion annotations from consolidated annotations database when it
+        holds all enabled databases, otherwise from the enabled databases providing them."""
+        sources = App.local_databases(params)
+        names = [settings["NAME"] for _, settings in sources]
+        databases: List[Db] = []
+        annotations = App.annotations_database(params.db_path, names, warn=False)
+        if annotations is not None:
+            databases.append(annotations)
+        else:
+            databases.extend(
+                db_class(params.db_path, readonly=True)
+                for db_class, settings in sources
+                if db_class.annotation_columns
+                and os.path.exists(os.path.join(params.db_path, f'{settings["NAME"].lower()}.db'))
             )
 
+        return FusionAnnotations(
+            databases, names, os.path.abspath(params.db_path), FusionIndex.timestamp(params.db_path)
+        )
+
+    @staticmethod
+    def local_databases(params: Namespace) -> List[Tuple[Type[Db], Dict[str, str]]]:
+        """Returns classes and settings of the enabled local databases."""
+        sources: List[Tuple[Type[Db], Dict[str, str]]] = []
+
+        if not params.no_cosmic:
+            sources.append((CosmicDB, Settings.COSMIC))
+
         if not params.no_fusiongdb2:
-            local_fusions.update(
-                {MitelmanDB(params.db_path).name: MitelmanDB(params.db_path).get_all_fusions()}
-            )
+            sources.append((MitelmanDB, Settings.MITELMAN))
 
         if not params.no_mitelman:
-            local_fusions.update(
-                {FusionGDB2(params.db_path).name: FusionGDB2(params.db_path).get_all_fusions()}
-            )
+            sources.append((FusionGDB2, Settings.FUSIONGDB2))
 
-        for fusion in self.manager.fusions:
-            for db_name, db_list in local_fusions.items():
-                if fusion.name in db_list:
-                    fusion.add_db(db_name)
+        return sources
+
+    @staticmethod
+    def annotations_database(
+        path: str, sources: List[str], warn: bool = True
+    ) -> AnnotationsDB | None:
+        """Returns consolidated annotations database when it exists and holds all sources
+        in their current version, see `AnnotationsDB.outdated`."""
+        if not os.path.exists(os.path.join(path, AnnotationsDB.file_name())):
+            return None
+        annotations = AnnotationsDB(path, readonly=True)
+        outdated = annotations.outdated(path, sources)
+        if not outdated:
+            return annotations
+        if warn:
+            Logger(__name__).warning(
+                "Annotations database is missing or outdated for %s, using databases",
+                ", ".join(outdated),
+            )
+        return None
 
     def export_results(self, path: str, extension: str) -> None:
         """Export results.
-        Currently supporting file types: JSON and CSV
+        Currently supporting file types: JSON, NDJSON (one fusion per line) and CSV.
+        Fusions are serialized one at a time, see `JsonStream`.
         """
         dest = f"{os.path.join(path, 'fusions')}.{extension}"
-        if extension == "json":
+        if extension in JsonStream.FORMATS:
             with open(dest, "w", encoding="utf-8") as output:
-                results = [fusion.json_serialize() for fusion in self.manager.fusions]
-                output.write(json.dumps(results))
+                JsonStream.write(
+                    output,
+                    (fusion.json_serialize() for fusion in self.manager.iter_fusions()),
+                    extension == "ndjson",
+                )
         elif extension == "csv":
             with open(dest, "w", encoding="utf-8") as output:
                 csv_writer = csv.writer(
@@ -159,7 +641,7 @@ class App:
                 header = ["Fusion", "Databases", "Fusion Indication Index (FII)", "Explained FII"]
                 header.extend([x for x in sorted(self.manager.running_tools)])
                 csv_writer.writerow(header)
-                for fusion in self.manager.fusions:
+                for fusion in self.manager.iter_fusions():
                     row: List[Any] = [
                         fusion.name,
                         ",".join(fusion.dbs),
@@ -191,12 +673,12 @@ class App:
         """
         # unfiltered list
         with open(os.path.join(path, "fusion_list.tsv"), "w", encoding="utf-8") as output:
-            for fusion in self.manager.fusions:
+            for fusion in self.manager.iter_fusions():
                 output.write(f"{fusion.name}\n")
 
         # filtered list
         with open(os.path.join(path, "fusion_list_filtered.tsv"), "w", encoding="utf-8") as output:
-            for fusion in self.manager.fusions:
+            for fusion in self.manager.iter_fusions():
                 if len(fusion.tools) >= cutoff:
                     output.write(f"{fusion.name}\n")
 
@@ -228,7 +710,7 @@ class App:
             db_provided -= Settings.FUSION_WEIGHTS["fusiongdb2"]
         if params.no_mitelman:
             db_provided -= Settings.FUSION_WEIGHTS["mitelman"]
-        for fusion in self.manager.fusions:
+        for fusion in self.manager.iter_fusions():
             # tool estimation
             tool_score: float = len(fusion.tools) / tools_provided
 
@@ -248,7 +730,7 @@ class App:
 
     @staticmethod
     def generate_multiqc(
-        path: str, fusions: List[Fusion], sample_name: str, running_tools_count: int
+        path: str, fusions: Iterable[Fusion], sample_name: str, running_tools_count: int
     ) -> None:
         """Helper function that generates MultiQC Fusion section (`fusion_genes_mqc.json`)."""
 
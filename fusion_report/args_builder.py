@@ -3,7 +3,7 @@
 import json
 import os
 from argparse import ArgumentParser, Namespace, _SubParsersAction
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 from fusion_report.settings import Settings
 
@@ -42,8 +42,10 @@ class ArgsBuilder:
     def build(self) -> None:
         """Build command-line arguments."""
         self.run_args(self.arguments["args"]["run"], self.arguments["weight"])
+        self.batch_args(self.arguments["args"]["batch"], self.arguments["args"]["run"])
         self.download_args(self.arguments["args"]["download"])
         self.sync_args(self.arguments["args"]["download"])
+        self.db_args(self.arguments["args"]["db"])
 
     def run_args(self, args, weight) -> None:
         """Build run command-line arguments."""
@@ -67,17 +69,52 @@ class ArgsBuilder:
         run_optional = run_parser.add_argument_group(
             "Optionals", "List of optional configuration parameters."
         )
-        for optional in args["optionals"]:
+        self._optionals(args["optionals"], run_optional)
+
+        for database in args["databases"]:
+            run_parser.add_argument(
+                database["key"],
+                help=database["help"],
+                action=database.get("action", "store"),
+            )
+
+    def batch_args(self, args: Dict[str, Any], run_args: Dict[str, Any]) -> None:
+        """Build batch command-line arguments. Batch accepts the same optionals as run."""
+        batch_parser = self.command_parser.add_parser(
+            "batch", help="Run application for all samples in a samplesheet"
+        )
+        batch_mandatory = batch_parser.add_argument_group(
+            "Mandatory arguments", "Required arguments to run app."
+        )
+        for mandatory in args["mandatory"]:
+            batch_mandatory.add_argument(mandatory["key"], help=mandatory["help"], type=str)
+
+        batch_optional = batch_parser.add_argument_group(
+            "Optionals", "List of optional configuration parameters."
+        )
+        self._optionals(run_args["optionals"] + args["optionals"], batch_optional)
+
+        for database in run_args["databases"]:
+            batch_parser.add_argument(
+                database["key"],
+                help=database["help"],
+                action=database.get("action", "store"),
+            )
+
+    @staticmethod
+    def _optionals(optionals: List[Dict[str, Any]], group) -> None:
+        """Add optional command-line arguments to the group."""
+        for optional in optionals:
             if len(optional["key"]) > 1:
                 if optional.get("action"):
-                    run_optional.add_argument(
+                    group.add_argument(
                         optional["key"][0],
                         optional["key"][1],
                         help=optional.get("help"),
                         action=optional.get("action"),
                     )
                 else:
-                    run_optional.add_argument(
+                    group.add_argument(
                         optional["key"][0],
                         optional["key"][1],
                         default=optional.get("default"),
@@ -86,27 +123,20 @@ class ArgsBuilder:
                     )
             else:
                 if optional.get("action"):
-                    run_optional.add_argument(
+                    group.add_argument(
                         optional["key"][0],
                         default=optional.get("default"),
                         help=optional.get("help"),
                         action=optional.get("action"),
                     )
                 else:
-                    run_optional.add_argument(
+                    group.add_argument(
                         optional["key"][0],
                         default=optional.get("default"),
                         help=optional.get("help"),
                         type=type(optional.get("default")),
                     )
 
-        for database in args["databases"]:
-            run_parser.add_argument(
-                database["key"],
-                help=database["help"],
-                action=database.get("action", "store"),
-            )
-
     def download_args(self, args: Dict[str, Any]) -> None:
         """Build download command-line arguments."""
         download_parser = self.command_parser.add_parser(
@@ -132,6 +162,21 @@ class ArgsBuilder:
 
         self._cosmic(args, download_parser)
 
+    def db_args(self, args: Dict[str, Any]) -> None:
+        """Build db command-line arguments."""
+        db_parser = self.command_parser.add_parser("db", help="Maintain downloaded databases")
+        db_command_parser = db_parser.add_subparsers(dest="db_command", required=True)
+        optimize_parser = db_command_parser.add_parser(
+            "optimize", help="Add missing indexes, update statistics and rebuild databases"
+        )
+        for mandatory in args["optimize"]["mandatory"]:
+            optimize_parser.add_argument(mandatory["key"], help=mandatory["help"], type=str)
+        consolidate_parser = db_command_parser.add_parser(
+            "consolidate", help="Build single annotations database from all databases"
+        )
+        for mandatory in args["consolidate"]["mandatory"]:
+            consolidate_parser.add_argument(mandatory["key"], help=mandatory["help"], type=str)
+
     def _cosmic(self, args: Dict[str, Any], parser) -> None:
         """Build COSMIC command-line arguments."""
         download_cosmic = parser.add_argument_group(
@@ -1,8 +1,12 @@
 """Database wrapper"""
 
+import csv
 import os
 import sqlite3
-from typing import List
+import weakref
+from itertools import chain, islice
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Tuple
 
 from fusion_report.common.exceptions.db import DbException
 from fusion_report.settings import Settings
@@ -14,15 +18,75 @@ class Db:
     Attributes:
         name: Database name
         schema: Schema defining database structure (sql file)
+        path: Folder of the database file
         database: Database file *.db
-        connection: Established connection to the database
+        connection: Established connection to the database, see `connection`
+        readonly: Connection is read-only and the database file is treated as immutable
+        table: Table holding the fusions
+        normalized_columns: SQL expressions computing normalized columns of the table from
+            the imported data: `fusion_pair` (GENEA--GENEB) and gene partners
+        attribute_columns: Columns describing the fusion record, kept in consolidated database
+        annotation_columns: SQL aggregates of the annotations shown in the report, `pubmed`,
+            `cancer_types`, `cosmic_phenotype_ids` (comma separated) and `mitelman_cases`
     """
 
-    def __init__(self, path: str, name: str, schema: str) -> None:
+    table: str = ""
+    normalized_columns: Dict[str, str] = {}
+    attribute_columns: List[str] = []
+    annotation_columns: Dict[str, str] = {}
+
+    # databases with an established connection, see `close_all`
+    _connected: "weakref.WeakSet[Db]" = weakref.WeakSet()
+
+    def __init__(self, path: str, name: str, schema: str, readonly: bool = False) -> None:
         self.name: str = name
         self._schema: str = schema
+        self.path: str = path
         self.database: str = f"{name.lower()}.db"
-        self.connection = self.connect(path, self.database)
+        self.readonly: bool = readonly
+        self._connection: sqlite3.Connection | None = None
+        self._pid: int | None = None
+        self.reconnect()
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """Returns connection to the database. SQLite connections must not be used across fork,
+        a forked process or a closed database establishes a new connection.
+
+        Raises:
+            DbException
+        """
+        if self._connection is None or self._pid != os.getpid():
+            return self.reconnect()
+        return self._connection
+
+    def reconnect(self) -> sqlite3.Connection:
+        """Establishes new connection to the database.
+
+        Returns:
+            connection object
+
+        Raises:
+            DbException
+        """
+        connection = self.connect(self.path, self.database)
+        self._connection = connection
+        self._pid = os.getpid()
+        Db._connected.add(self)
+        return connection
+
+    def close(self) -> None:
+        """Closes connection to the database, the connection is established again on next use."""
+        if self._connection is not None and self._pid == os.getpid():
+            self._connection.close()
+        self._connection = None
+        Db._connected.discard(self)
+
+    @classmethod
+    def close_all(cls) -> None:
+        """Closes connections of all databases, e.g. before the process is forked."""
+        for database in list(cls._connected):
+            database.close()
 
     def connect(self, path: str, database: str):
         """Method for establishing connection to the database.
@@ -34,7 +98,17 @@ class Db:
             DbException
         """
         try:
-            connection = sqlite3.connect(os.path.join(path, database))
+            if self.readonly:
+                # no locking and no change detection, pages are shared through the OS page cache;
+                # read-only connection can be safely shared by threads
+                uri = Path(os.path.abspath(os.path.join(path, database))).as_uri()
+                connection = sqlite3.connect(
+                    f"{uri}?mode=ro&immutable=1", uri=True, check_same_thread=False
+                )
+                connection.execute(f"PRAGMA mmap_size = {Settings.DB_MMAP_SIZE}")
+            else:
+                connection = sqlite3.connect(os.path.join(path, database))
+            # `select` returns dictionaries in both modes
             connection.row_factory = self.__dict_factory
             return connection
         except sqlite3.DatabaseError as ex:
@@ -45,7 +119,9 @@ class Db:
     ) -> None:
         """Sets up database. For most databases there is available schema and text files which
         contain all the data. This methods builds database using it's schema and imports
-        all provided data files.
+        all provided data files. Files are streamed in batches, normalized and indexed in a
+        single transaction. The database file is deleted when the import fails, so a partially
+        imported database is never used.
 
          Args:
              files: all necessary files required to be imported
@@ -57,31 +133,212 @@ class Db:
              DbException
         """
         try:
-            # build database schema
-            self.create_database()
+            # indexes are built once all the data are imported
+            indexes = self.create_database(indexes=False)
+            self.__import_pragmas(True)
+            self.connection.execute("BEGIN")
             # import all data files except .sql files
             for file in filter(lambda x: not x.endswith(".sql"), files):
-                with open(file, "r", encoding=encoding) as resource:
+                with open(file, "r", encoding=encoding, newline="") as resource:
+                    reader = csv.reader(resource, delimiter=delimiter)
                     if skip_header:
-                        next(resource)
-                    first_line: List[str] = resource.readline().split(delimiter)
-                    rows: List[List[str]] = [first_line]
-                    for line in resource:
-                        row = line.split(delimiter)
-                        rows.append(row + ["" for _ in range(len(row), len(first_line))])
-                    self.connection.executemany(
-                        f"""INSERT INTO {file.split('/')[-1].split('.')[0].lower()}
-                            VALUES ({','.join(['?' for _ in range(0, len(first_line))])})""",
-                        rows,
+                        next(reader, None)
+                    first_line: List[str] | None = next(reader, None)
+                    if first_line is None:
+                        continue
+                    table = file.split("/")[-1].split(".")[0].lower()
+                    # normalized columns are filled after the import, columns of the file
+                    # missing in the table are ignored
+                    columns = self.columns(table)[: len(first_line)]
+                    width = len(columns)
+                    query = f"""INSERT INTO {table} ({','.join(columns)})
+                                VALUES ({','.join(['?' for _ in range(0, width)])})"""
+                    rows: Iterator[List[str]] = chain(
+                        [first_line[:width]],
+                        (row[:width] + [""] * (width - len(row)) for row in reader),
                     )
-                    self.connection.commit()
-        except (IOError, sqlite3.Error) as ex:
+                    while batch := list(islice(rows, Settings.IMPORT_BATCH_SIZE)):
+                        self.connection.executemany(query, batch)
+            self.__normalize()
+            for index in indexes:
+                self.connection.execute(index)
+            self.connection.commit()
+        except (IOError, ValueError, csv.Error, sqlite3.Error, DbException) as ex:
+            self.__discard()
             raise DbException(ex) from ex
+        self.__import_pragmas(False)
+
+    def __discard(self) -> None:
+        """Rolls back the failed import and deletes the database file."""
+        try:
+            self.connection.rollback()
+        except sqlite3.Error:
+            pass
+        self.close()
+        try:
+            os.remove(os.path.join(self.path, self.database))
+        except FileNotFoundError:
+            pass
+
+    def create_database(self, indexes: bool = True) -> List[str]:
+        """Build database from schema file.
 
-    def create_database(self):
-        """Build database from schema file."""
+        Args:
+            indexes: create indexes defined in the schema, otherwise they are returned so they
+                can be created after the data are imported
+
+        Returns:
+            Statements creating indexes which were not executed
+        """
         with open(self.schema, "r", encoding="utf-8") as schema:
-            self.connection.executescript(schema.read().lower())
+            statements = [
+                statement.strip()
+                for statement in schema.read().lower().split(";")
+                if statement.strip()
+            ]
+        deferred = [
+            statement
+            for statement in statements
+            if not indexes and statement.startswith("create index")
+        ]
+        self.connection.executescript(
+            "".join(f"{statement};\n" for statement in statements if statement not in deferred)
+        )
+        # normalized columns are indexed by `normalize` as well
+        return [
+            statement.replace("create index", "create index if not exists", 1)
+            for statement in deferred
+        ]
+
+    def __import_pragmas(self, enabled: bool) -> None:
+        """Trades durability for speed while the data are imported, the rollback journal is kept
+        in memory and the database is deleted when the import fails."""
+        if enabled:
+            self.connection.execute("PRAGMA journal_mode = MEMORY")
+            self.connection.execute("PRAGMA synchronous = OFF")
+            self.connection.execute(f"PRAGMA cache_size = -{Settings.IMPORT_CACHE_SIZE}")
+        else:
+            self.connection.execute("PRAGMA journal_mode = DELETE")
+            self.connection.execute("PRAGMA synchronous = FULL")
+            self.connection.execute("PRAGMA cache_size = -2000")
+
+    def normalize(self) -> None:
+        """Fills normalized columns of the fusion table and makes sure they are indexed. Columns
+        and indexes missing in databases built by older versions are created.
+
+        Raises:
+            DbException
+        """
+        try:
+            with self.connection:
+                self.__normalize()
+        except sqlite3.Error as ex:
+            raise DbException(ex) from ex
+
+    def __normalize(self) -> None:
+        """Statements of `normalize`, executed in the current transaction.
+
+        Raises:
+            DbException
+            sqlite3.Error
+        """
+        if not self.normalized_columns:
+            return
+        columns = self.columns(self.table)
+        for column in self.normalized_columns:
+            if column not in columns:
+                self.connection.execute(
+                    f"ALTER TABLE {self.table} "
+                    f"ADD COLUMN {column} varchar(255) NOT NULL DEFAULT ''"
+                )
+        # single pass, each row is rewritten only once
+        self.connection.execute(
+            f"UPDATE {self.table} SET "
+            + ", ".join(
+                f"{column} = {expression}" for column, expression in self.normalized_columns.items()
+            )
+        )
+        for column in self.normalized_columns:
+            indexed = column if column == "fusion_pair" else f"{column}, fusion_pair"
+            self.connection.execute(
+                f"CREATE INDEX IF NOT EXISTS {self.name.lower()}_{column}_index "
+                f"ON {self.table}({indexed})"
+            )
+
+    def optimize(self) -> None:
+        """Normalizes the database, updates statistics of the query planner and rebuilds
+        the database file.
+
+        Raises:
+            DbException
+        """
+        self.normalize()
+        try:
+            self.connection.execute("ANALYZE")
+            self.connection.commit()
+            self.connection.execute("VACUUM")
+        except sqlite3.Error as ex:
+            raise DbException(ex) from ex
+
+    @staticmethod
+    def partners(fusion_pair: str) -> Dict[str, str]:
+        """Returns SQL expressions of gene partners of the fusion pair expression."""
+        separator = f"instr({fusion_pair}, '--')"
+        return {
+            "five_prime_partner": (
+                f"CASE WHEN {separator} > 0 "
+                f"THEN substr({fusion_pair}, 1, {separator} - 1) ELSE '' END"
+            ),
+            "three_prime_partner": (
+                f"CASE WHEN {separator} > 0 "
+                f"THEN substr({fusion_pair}, {separator} + 2) ELSE '' END"
+            ),
+        }
+
+    def get_annotations(
+        self, fusion_pairs: List[str], sources: List[str] | None = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """Returns annotations of the fusions in a single query.
+
+        Args:
+            fusion_pairs: Fusions in format GENEA--GENEB
+            sources: Names of the enabled databases, nothing is returned when the database
+                is not one of them
+
+        Returns:
+            Values of `annotation_columns` keyed by fusion pair, fusions without any record
+            are missing
+        """
+        if (
+            not self.annotation_columns
+            or not fusion_pairs
+            or (sources is not None and self.name not in sources)
+        ):
+            return {}
+        fusion_pair = self.normalized("fusion_pair")
+        query: str = f"""SELECT {fusion_pair}, {', '.join(self.annotation_columns.values())}
+                         FROM {self.table}
+                         WHERE {fusion_pair} IN ({', '.join(['?' for _ in fusion_pairs])})
+                         GROUP BY 1"""
+        return {
+            row[0]: dict(zip(self.annotation_columns, row[1:]))
+            for row in self.select_rows(query, fusion_pairs)
+        }
+
+    def get_codes(self) -> Dict[str, str]:
+        """Returns descriptions of codes used by the annotations, keyed by code."""
+        return {}
+
+    def normalized(self, column: str) -> str:
+        """Returns normalized column or the expression computing it, when the database was built
+        by an older version without normalized columns."""
+        if column in self.columns(self.table):
+            return column
+        return f"({self.normalized_columns[column]})"
+
+    def columns(self, table: str) -> List[str]:
+        """Returns column names of the table, the current transaction is not committed."""
+        return [column[1] for column in self.select_rows(f"PRAGMA table_info({table})")]
 
     def select(self, query: str, params: List[str] = None):
         """Select data from table.
@@ -102,6 +359,30 @@ class Db:
         except sqlite3.OperationalError as ex:
             raise DbException(ex) from ex
 
+    def select_column(self, query: str, params: List[str] = None) -> List[Any]:
+        """Select values of a single column, rows are not converted.
+
+        Raises:
+            DbException
+        """
+        return [row[0] for row in self.select_rows(query, params)]
+
+    def select_rows(self, query: str, params: List[str] = None) -> List[Tuple[Any, ...]]:
+        """Select rows as plain tuples.
+
+        Raises:
+            DbException
+        """
+        try:
+            cur = self.connection.cursor()
+            cur.row_factory = None
+            cur.execute(query, params or [])
+            res = cur.fetchall()
+            cur.close()
+            return res
+        except sqlite3.OperationalError as ex:
+            raise DbException(ex) from ex
+
     def execute(self, query: str, params: List[str] = None):
         """Execute SQL statement. Can be anything like INSERT/UPDATE/DELETE ...
 
@@ -0,0 +1,7 @@
+"""Parser Exception"""
+
+
+class ParserException(Exception):
+    """Raised when fusion detection tool output can't be parsed."""
+
+    pass
@@ -1,10 +1,14 @@
 """Fusion Manager"""
 
-from typing import Any, Dict, List, Set, Tuple
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Set, Tuple
 
 from fusion_report.common.exceptions.app import AppException
+from fusion_report.common.exceptions.parser import ParserException
 from fusion_report.common.logger import Logger
 from fusion_report.common.models.fusion import Fusion
+from fusion_report.common.reader import Reader
 
 
 class FusionManager:
@@ -12,13 +16,13 @@ class FusionManager:
        individual parsed fusion.
 
     Attributes:
-        fusions: List of parsed fusions
+        registry: Insertion-ordered collection of parsed fusions keyed by fusion name
         running_tools: List of executed fusion detection tools
         supported_tools: List of all supported fusion detection tools
     """
 
     def __init__(self, supported_tools: List[str]) -> None:
-        self.fusions: List[Fusion] = []
+        self.registry: Dict[str, Fusion] = {}
         self.running_tools: Set[str] = set()
         self.supported_tools: List[str] = supported_tools
 
@@ -30,40 +34,136 @@ class FusionManager:
         """
         if tool in self.supported_tools:
             self.running_tools.add(tool)
-            factory_parser = self.__build_factory(tool)
-            try:
-                with open(file, "r", encoding="utf-8") as fusion_output:
-                    factory_parser.set_header(fusion_output.readline().replace('"', ""))
-                    for line in fusion_output:
-                        line = line.replace('"', "").strip()
-                        fusion_list: List[Tuple[str, Dict[str, Any]]] = factory_parser.parse(line)
-                        if allow_multiple_genes is None and len(fusion_list) > 1:
-                            fusion_list = [fusion_list[0]]
-                        for fusion_name, details in fusion_list:
-                            self.add(fusion_name, tool, details)
-            except IOError as ex:
-                raise AppException(ex) from ex
+            for fusion_name, details in self.iter_read(tool, file, allow_multiple_genes):
+                self.add(fusion_name, tool, details)
         else:
             Logger(__name__).error(
                 "Tool %s is not supported. To integrate the tool please create an issue",
                 tool,
             )
 
+    def parse_all(
+        self,
+        outputs: List[Tuple[str, str]],
+        allow_multiple_genes: bool,
+        workers: int = 1,
+        processes: bool = False,
+    ) -> None:
+        """Parses outputs of several tools. By default the files are parsed one after another and
+        their fusions are streamed into the registry. With a pool of workers each file is read
+        by a worker and the results are merged in the order of `outputs`, releasing the records
+        of a tool once merged, so the result is identical to the serial run. Standard input (`-`)
+        is always read by the caller, worker processes don't inherit it.
+
+        Args:
+            outputs: list of (tool, file) pairs
+            allow_multiple_genes: report all proposed fusions instead of the first one
+            workers: size of the pool, serial parsing if lower than 2
+            processes: use a pool of processes instead of threads
+
+        Raises:
+            AppException
+        """
+        supported = [(tool, file) for tool, file in outputs if tool in self.supported_tools]
+        for tool, _ in outputs:
+            if tool not in self.supported_tools:
+                Logger(__name__).error(
+                    "Tool %s is not supported. To integrate the tool please create an issue",
+                    tool,
+                )
+
+        if workers < 2 or len(supported) < 2:
+            for tool, file in supported:
+                self.parse(tool, file, allow_multiple_genes)
+            return
+
+        executor: type[Executor] = ProcessPoolExecutor if processes else ThreadPoolExecutor
+        with executor(max_workers=min(workers, len(supported))) as pool:
+            # standard input is not inherited by worker processes, it's read by the caller
+            pending: Deque[Future | None] = deque(
+                None if file == "-" else pool.submit(self.read, tool, file, allow_multiple_genes)
+                for tool, file in supported
+            )
+            # results are merged in order, each one is released after it is merged
+            for tool, file in supported:
+                future = pending.popleft()
+                fusions: Iterable[Tuple[str, Dict[str, Any]]] = (
+                    self.iter_read(tool, file, allow_multiple_genes)
+                    if future is None
+                    else future.result()
+                )
+                self.running_tools.add(tool)
+                for fusion_name, details in fusions:
+                    self.add(fusion_name, tool, details)
+
+    @classmethod
+    def read(
+        cls, tool: str, file: str, allow_multiple_genes: bool
+    ) -> List[Tuple[str, Dict[str, Any]]]:
+        """Parses output of a tool without storing the results.
+
+        Returns:
+            List of parsed fusions and their details, in file order
+
+        Raises:
+            AppException
+        """
+        return list(cls.iter_read(tool, file, allow_multiple_genes))
+
+    @classmethod
+    def iter_read(
+        cls, tool: str, file: str, allow_multiple_genes: bool
+    ) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Lazy variant of `read`, parsed fusions are yielded as the file is read.
+
+        Raises:
+            AppException
+        """
+        factory_parser = cls.__build_factory(tool)
+        try:
+            with Reader.open(file) as fusion_output:
+                factory_parser.set_header(fusion_output.readline().replace('"', ""))
+                for line in fusion_output:
+                    line = line.replace('"', "").strip()
+                    fusion_list: List[Tuple[str, Dict[str, Any]]] = factory_parser.parse(line)
+                    if allow_multiple_genes is None and len(fusion_list) > 1:
+                        fusion_list = [fusion_list[0]]
+                    yield from fusion_list
+        except (IOError, ValueError, ParserException) as ex:
+            raise AppException(ex) from ex
+
     def add(self, fusion_name: str, tool: str, details: Dict[str, Any]) -> None:
         """Insert of append new parsed information to specific fusion."""
         if fusion_name and tool:
-            index = self.index_by(fusion_name)
-            if index == -1:
+            fusion = self.registry.get(fusion_name)
+            if fusion is None:
                 fusion = Fusion(fusion_name)
-                fusion.add_tool(tool, details)
-                self.fusions.append(fusion)
-            else:
-                fusion = self.fusions[index]
-                fusion.add_tool(tool, details)
+                self.registry[fusion_name] = fusion
+            fusion.add_tool(tool, details)
+
+    @property
+    def fusions(self) -> List[Fusion]:
+        """Returns ordered list of all parsed fusions. Kept for backward compatibility,
+        prefer `iter_fusions` which does not copy the collection."""
+        return list(self.registry.values())
+
+    def iter_fusions(self) -> Iterator[Fusion]:
+        """Iterates over all parsed fusions in insertion order."""
+        return iter(self.registry.values())
+
+    def get_fusion(self, name: str) -> Fusion | None:
+        """Returns fusion by its name or None if the fusion was not parsed."""
+        return self.registry.get(name)
 
     def get_known_fusions(self) -> List[Fusion]:
         """Returns list of all fusions found in local databases."""
-        return [fusion for fusion in self.fusions if fusion.dbs]
+        return [fusion for fusion in self.registry.values() if fusion.dbs]
+
+    def __contains__(self, name: object) -> bool:
+        return name in self.registry
+
+    def __len__(self) -> int:
+        return len(self.registry)
 
     ################################################################################################
     #  Helpers
@@ -85,15 +185,3 @@ class FusionManager:
             return klass()
         except AttributeError as ex:
             raise AppException(ex) from ex
-
-    def index_by(self, value: str) -> int:
-        """Helper for finding fusion based on its name.
-
-        Returns:
-            >=0 index of a fusion in the list
-            -1: not found
-        """
-        for index, fusion in enumerate(self.fusions):
-            if fusion.name == value:
-                return index
-        return -1
@@ -0,0 +1,68 @@
+"""Streaming JSON writer"""
+
+import json
+from typing import Any, Callable, Iterable, TextIO
+
+
+class JsonStream:
+    """Writes items as a JSON array or newline delimited JSON (NDJSON) one item at a time, so
+    only a single serialized item is held in memory. The JSON array is written exactly as
+    `json.dumps` of the whole list, so the export doesn't change. NDJSON items are compact JSON
+    (no whitespace, non-ASCII characters as UTF-8), serialized by the optional `orjson` package
+    when it is installed, by the standard `json` module in the same format otherwise.
+    """
+
+    FORMATS = ("json", "ndjson")
+
+    @classmethod
+    def write(cls, output: TextIO, items: Iterable[Any], ndjson: bool = False) -> int:
+        """Writes items to the output.
+
+        Args:
+            output: text stream
+            items: JSON serializable items
+            ndjson: write one item per line instead of a JSON array
+
+        Returns:
+            Number of written items
+        """
+        dumps = cls.serializer() if ndjson else json.dumps
+        count = 0
+        if not ndjson:
+            output.write("[")
+        for item in items:
+            if ndjson:
+                output.write(dumps(item))
+                output.write("\n")
+            else:
+                # separator of `json.dumps`
+                if count:
+                    output.write(", ")
+                output.write(dumps(item))
+            count += 1
+        if not ndjson:
+            output.write("]")
+
+        return count
+
+    @staticmethod
+    def serializer() -> Callable[[Any], str]:
+        """Returns the fastest available serializer of a single NDJSON item."""
+        try:
+            import orjson
+        except ImportError:
+            return JsonStream.dumps
+
+        def dumps(item: Any) -> str:
+            try:
+                return orjson.dumps(item).decode("utf-8")
+            except TypeError:
+                # types orjson doesn't support, e.g. non-string keys or big integers
+                return JsonStream.dumps(item)
+
+        return dumps
+
+    @staticmethod
+    def dumps(item: Any) -> str:
+        """Serializes the item by the standard `json` module in the format of `orjson`."""
+        return json.dumps(item, separators=(",", ":"), ensure_ascii=False)
@@ -1,54 +1,121 @@
 """Fusion Model"""
 
-from typing import Any, Dict, List
+import sys
+from typing import Any, Dict, Iterator, List, Mapping, Tuple
 
 from fusion_report.common.logger import Logger
 
+# Detail record of a tool: shared key schema and values
+ToolRecord = Tuple[Tuple[str, ...], Tuple[Any, ...]]
+
+
+class ToolDetails(Mapping[str, Dict[str, Any]]):
+    """Read-only view of tool details stored in compact records. Detail dictionaries are built
+    only when accessed, membership, length and iteration don't create any.
+    """
+
+    __slots__ = ("_records",)
+
+    def __init__(self, records: Dict[str, ToolRecord]) -> None:
+        self._records = records
+
+    def __getitem__(self, tool: str) -> Dict[str, Any]:
+        keys, values = self._records[tool]
+        return dict(zip(keys, values))
+
+    def __contains__(self, tool: object) -> bool:
+        return tool in self._records
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._records)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __repr__(self) -> str:
+        return repr(dict(self.items()))
+
 
 class Fusion:
     """Represents all required properties defining a fusion between two genes.
 
+    Instances use `__slots__` and keep a compact representation: databases are stored as a tuple
+    of interned database names and tool details as tuples of values sharing a key schema. The
+    public properties return the same shapes as plain lists and dictionaries would.
+
     Attributes:
         name: Fusion name
         score: Fusion Indication Index, attributes: `score` and `explained`
         dbs: List of databases where fusion was found
         tools: List of tools which detected fusion
+        breakpoint_matches: Tools whose breakpoints match a catalogued COSMIC event, None when
+            breakpoints were not checked
     """
 
+    __slots__ = ("name", "_score", "_score_explained", "_dbs", "_tools", "_breakpoint_matches")
+
+    # shared by all instances
+    _schemas: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+
     def __init__(self, name: str) -> None:
         self.name: str = name.strip()
-        self._score: Dict[str, Any] = {"score": 0, "explained": ""}
-        self.dbs: List[str] = []
-        self.tools: Dict[str, Any] = {}
+        self._score: float = 0
+        self._score_explained: str = ""
+        self._dbs: Tuple[str, ...] = ()
+        self._tools: Dict[str, ToolRecord] = {}
+        self._breakpoint_matches: Tuple[str, ...] | None = None
 
     @property
     def score(self) -> float:
-        return self._score["score"]
+        return self._score
 
     @score.setter
     def score(self, value: float) -> None:
-        self._score["score"] = float(value)
+        self._score = float(value)
 
     @property
     def score_explained(self) -> str:
         """Returns explanation of how the FII was calculated."""
-        return self._score["explained"]
+        return self._score_explained
 
     @score_explained.setter
     def score_explained(self, value: str) -> None:
-        self._score["explained"] = value
+        self._score_explained = value
+
+    @property
+    def dbs(self) -> List[str]:
+        """Returns list of databases where fusion was found."""
+        return list(self._dbs)
+
+    @property
+    def tools(self) -> ToolDetails:
+        """Returns details of each tool which detected fusion."""
+        return ToolDetails(self._tools)
+
+    @property
+    def breakpoint_matches(self) -> List[str] | None:
+        """Returns tools whose breakpoints match a catalogued COSMIC event."""
+        if self._breakpoint_matches is None:
+            return None
+        return list(self._breakpoint_matches)
+
+    @breakpoint_matches.setter
+    def breakpoint_matches(self, tools: List[str]) -> None:
+        self._breakpoint_matches = tuple(sys.intern(tool) for tool in tools)
 
     def add_tool(self, tool: str, details: Dict[str, Any]) -> None:
         """Add new fusion tool to the list."""
-        if tool and tool not in self.tools.keys():
-            self.tools[tool] = details
+        if tool and tool not in self._tools:
+            keys = tuple(details)
+            schema = self._schemas.setdefault(keys, keys)
+            self._tools[sys.intern(tool)] = (schema, tuple(details.values()))
         else:
             Logger(__name__).debug("Tool %s already in list or empty", tool)
 
     def add_db(self, database: str) -> None:
         """Add new database to the list."""
-        if database and database not in self.dbs:
-            self.dbs.append(database)
+        if database and database not in self._dbs:
+            self._dbs += (sys.intern(database),)
         else:
             Logger(__name__).debug("Database %s already in list or empty", database)
 
@@ -60,5 +127,7 @@ class Fusion:
             "Fusion Indication Index (FII)": self.score,
             "Explained FII": self.score_explained,
         }
+        if self._breakpoint_matches is not None:
+            json["COSMIC breakpoint matches"] = self.breakpoint_matches
 
         return {**json, **self.tools}
@@ -231,8 +231,11 @@ class Net:
             url: str = f'{Settings.MITELMAN["HOSTNAME"]}/{Settings.MITELMAN["FILE"]}'
             Net.get_large_file(url, no_ssl)
             with ZipFile(Settings.MITELMAN["FILE"], "r") as archive:
+                # cases and translation of their codes
                 files = [
-                    x for x in archive.namelist() if "MBCA.TXT.DATA" in x and "MACOSX" not in x
+                    x
+                    for x in archive.namelist()
+                    if ("MBCA.TXT.DATA" in x or "KODER.TXT.DATA" in x) and "MACOSX" not in x
                 ]
                 archive.extractall()
 
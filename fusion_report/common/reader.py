@@ -0,0 +1,58 @@
+"""Input reader"""
+
+import gzip
+import io
+import sys
+from contextlib import ExitStack, contextmanager
+from typing import BinaryIO, Iterator, TextIO
+
+from fusion_report.common.exceptions.parser import ParserException
+from fusion_report.settings import Settings
+
+
+class Reader:
+    """Opens fusion detection tool outputs. Plain text, gzip/bgzip and zstd compressed files are
+    supported, compression is detected from magic bytes. Use `-` to read from standard input,
+    named pipes are read as any other file since the stream is never rewound.
+    """
+
+    GZIP_MAGIC: bytes = b"\x1f\x8b"
+    ZSTD_MAGIC: bytes = b"\x28\xb5\x2f\xfd"
+
+    @staticmethod
+    @contextmanager
+    def open(file: str, encoding: str = "utf-8") -> Iterator[TextIO]:
+        """Context manager returning text stream of the file, decompressed if needed.
+
+        Raises:
+            IOError
+            ParserException
+        """
+        with ExitStack() as stack:
+            if file == "-":
+                stream: BinaryIO = sys.stdin.buffer
+            else:
+                stream = stack.enter_context(open(file, "rb", buffering=Settings.READ_BUFFER_SIZE))
+
+            magic: bytes = stream.peek(4)[:4]  # type: ignore
+            if magic.startswith(Reader.GZIP_MAGIC):
+                stream = stack.enter_context(gzip.GzipFile(fileobj=stream, mode="rb"))
+            elif magic.startswith(Reader.ZSTD_MAGIC):
+                stream = stack.enter_context(Reader._open_zstd(stream))
+
+            yield io.TextIOWrapper(stream, encoding=encoding)  # type: ignore
+
+    @staticmethod
+    def _open_zstd(stream: BinaryIO) -> BinaryIO:
+        """Returns decompressed zstd stream, requires the optional `zstandard` package."""
+        try:
+            import zstandard
+        except ImportError as ex:
+            raise ParserException(
+                "Reading zstd compressed outputs requires the zstandard package"
+            ) from ex
+
+        return io.BufferedReader(
+            zstandard.ZstdDecompressor().stream_reader(stream, closefd=False),
+            buffer_size=Settings.READ_BUFFER_SIZE,
+        )
@@ -1,22 +1,42 @@
 """Report class"""
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
+
+from jinja2 import Environment
 
 from fusion_report.common.exceptions.report import ReportException
 from fusion_report.common.page import Page
+from fusion_report.common.report_writer import ReportWriter
 from fusion_report.common.template import Template
+from fusion_report.config import Config
 
 
 class Report(Template):
-    """Report is the base container containing all types of pages.
+    """Report is the base container containing all types of pages. Pages are not retained
+    once created, they are rendered and dropped by the caller, so memory doesn't depend on the
+    number of pages.
 
     Attributes:
-        pages: List of pages
+        page_index: Position of each created page keyed by its file name
     """
 
-    def __init__(self, config_path: str, output_dir: str) -> None:
-        self.pages: List[Page] = []
-        super().__init__(config_path, output_dir)
+    def __init__(
+        self,
+        config_path: str,
+        output_dir: str,
+        j2_env: Environment | None = None,
+        j2_variables: Config | None = None,
+        assets: str = "inline",
+        hash_assets: bool = False,
+        writer: ReportWriter | None = None,
+        minify: bool = False,
+    ) -> None:
+        self.page_index: Dict[str, int] = {}
+        # menu and libraries of pages with the same modules
+        self.__layouts: Dict[Tuple[str, ...], Dict[str, Any]] = {}
+        super().__init__(
+            config_path, output_dir, j2_env, j2_variables, assets, hash_assets, writer, minify
+        )
 
     def create_page(
         self,
@@ -25,7 +45,7 @@ class Report(Template):
         filename: str = None,
         page_variables: Dict[str, Any] = None,
     ) -> Page:
-        """Creates and adds page in the list.
+        """Creates page and registers its file name.
 
         Return:
             page: Page object
@@ -40,24 +60,9 @@ class Report(Template):
         if self.index_by(filename) != -1:
             raise ReportException(f"Page {page.filename} already exists!")
 
-        self.pages.append(page)
+        self.page_index[page.filename] = len(self.page_index)
         return page
 
-    def get_page(self, filename: str) -> Page:
-        """Search page by its file name.
-
-        Returns:
-            page
-
-        Raises:
-            ReportException
-        """
-        index = self.index_by(filename)
-        if index == -1:
-            raise ReportException(f"Page {filename} not found")
-
-        return self.pages[index]
-
     def render(self, page: Page, extra_variables: Dict[str, Any] = None):
         """Method for rendering page using templating engine."""
         template_variables: Dict[str, Any] = page.get_content()
@@ -65,17 +70,36 @@ class Report(Template):
         # load modules
         template_variables["modules"] = page.modules
 
-        # generate menu (html_id, menu item): List[Tuple[str, str]]
-        template_variables["menu"] = []
-        for _, module in template_variables["modules"].items():
-            for item in module["menu"]:
-                template_variables["menu"].append((self.get_id(item), item))
+        # menu and libraries depend only on the modules
+        layout_key = tuple(page.modules.keys())
+        if layout_key not in self.__layouts:
+            self.__layouts[layout_key] = self.layout(page.modules)
+        template_variables.update(self.__layouts[layout_key])
 
         if extra_variables:
             template_variables = {**template_variables, **extra_variables}
 
         super().render(page, template_variables)
 
+    def layout(self, modules: Dict[str, Any]) -> Dict[str, Any]:
+        """Returns menu and vendor libraries of a page with the modules.
+
+        Returns:
+            menu: (html_id, menu item): List[Tuple[str, str]]
+            libraries: vendor libraries required by the modules: {"css": [], "js": []}
+        """
+        menu: List[Tuple[str, str]] = []
+        libraries: Dict[str, List[str]] = {"css": [], "js": []}
+        for _, module in modules.items():
+            for item in module["menu"]:
+                menu.append((self.get_id(item), item))
+            for asset_type, assets in module.get("libraries", {}).items():
+                for asset in assets:
+                    if asset not in libraries[asset_type]:
+                        libraries[asset_type].append(asset)
+
+        return {"menu": menu, "libraries": libraries}
+
     def index_by(self, value: str | None) -> int:
         """Find page based on its filename.
 
@@ -84,8 +108,6 @@ class Report(Template):
             -1: page doesn't exist
         """
         if value:
-            for index, page in enumerate(self.pages):
-                if page.filename == value:
-                    return index
+            return self.page_index.get(value, -1)
 
         return -1
@@ -0,0 +1,150 @@
+"""Manifest of report pages"""
+
+import json
+import os
+from hashlib import sha256
+from typing import Any, Dict, List, Tuple
+
+from fusion_report.common.exceptions.report import ReportException
+from fusion_report.settings import Settings
+
+
+class ReportManifest:
+    """Inputs and content hashes of the pages written to the output directory, used to
+    regenerate the report incrementally. A page whose inputs didn't change since the previous
+    run is kept as it is, rendered pages are written only when their content changed and pages
+    of the previous run missing in the current run are deleted.
+
+    Attributes:
+        path: Output directory
+        version: Hash of inputs shared by all pages: fusion-report version, templates,
+            configuration and databases, pages of a previous run with another version are
+            rendered again
+        previous: Pages of the previous run, `inputs` and `content` hashes keyed by file name
+        outdated: Previous run has another version
+        pages: Pages of the current run
+        kept: Pages of the current run kept from the previous run
+    """
+
+    VERSION: int = 1
+
+    def __init__(self, path: str, shared_inputs: Dict[str, Any]) -> None:
+        self.path = path
+        self.version: str = self.digest(
+            {
+                "manifest": self.VERSION,
+                "fusion_report": Settings.VERSION,
+                "templates": self.templates(),
+                **shared_inputs,
+            }
+        )
+        self.previous: Dict[str, Dict[str, str]] = {}
+        self.outdated: bool = True
+        try:
+            with open(
+                os.path.join(path, Settings.REPORT_MANIFEST), "r", encoding="utf-8"
+            ) as manifest:
+                content = json.load(manifest)
+            self.previous = content["pages"]
+            self.outdated = content["version"] != self.version
+        except (IOError, ValueError, KeyError):
+            pass
+        self.pages: Dict[str, Dict[str, str]] = {}
+        self.kept: List[str] = []
+
+    def is_current(self, filename: str, inputs: str) -> bool:
+        """Checks whether the page was written by the previous run from the same inputs, the
+        inputs are recorded for the page otherwise."""
+        entry = self.previous.get(filename)
+        if (
+            not self.outdated
+            and entry is not None
+            and entry.get("inputs") == inputs
+            and os.path.isfile(os.path.join(self.path, filename))
+        ):
+            self.pages[filename] = entry
+            self.kept.append(filename)
+            return True
+
+        self.pages[filename] = {"inputs": inputs}
+        return False
+
+    def changed(self, filename: str, content: str) -> bool:
+        """Records hash of the rendered page and checks whether it has to be written, i.e. the
+        file of the previous run has another content."""
+        digest = sha256(content.encode("utf-8")).hexdigest()
+        entry = self.previous.get(filename)
+        self.pages[filename] = {
+            "inputs": self.pages.get(filename, {}).get("inputs", ""),
+            "content": digest,
+        }
+        return (
+            entry is None
+            or entry.get("content") != digest
+            or not os.path.isfile(os.path.join(self.path, filename))
+        )
+
+    def save(self) -> List[str]:
+        """Deletes pages of the previous run missing in the current run, including their
+        compressed siblings, and writes the manifest.
+
+        Returns:
+            Deleted pages
+
+        Raises:
+            ReportException
+        """
+        deleted: List[str] = []
+        for filename in self.previous:
+            # only pages written directly to the output directory are deleted
+            if filename in self.pages or os.path.basename(filename) != filename:
+                continue
+            for name in (filename, f"{filename}.gz", f"{filename}.br"):
+                try:
+                    os.remove(os.path.join(self.path, name))
+                    if name == filename:
+                        deleted.append(filename)
+                except FileNotFoundError:
+                    pass
+                except IOError as ex:
+                    raise ReportException(ex) from ex
+
+        try:
+            with open(
+                os.path.join(self.path, Settings.REPORT_MANIFEST), "w", encoding="utf-8"
+            ) as manifest:
+                json.dump(
+                    {"version": self.version, "pages": self.pages},
+                    manifest,
+                    sort_keys=True,
+                )
+        except IOError as ex:
+            raise ReportException(ex) from ex
+
+        return deleted
+
+    @staticmethod
+    def digest(inputs: Any) -> str:
+        """Returns hash of JSON serializable inputs."""
+        return sha256(
+            json.dumps(inputs, sort_keys=True, separators=(",", ":"), default=str).encode("utf-8")
+        ).hexdigest()
+
+    @staticmethod
+    def templates() -> List[Tuple[str, int, int]]:
+        """Returns path, size and modification time of templates and modules."""
+        files: List[Tuple[str, int, int]] = []
+        for directory in ("templates", "modules"):
+            for root, _, filenames in os.walk(os.path.join(Settings.ROOT_DIR, directory)):
+                for filename in filenames:
+                    if filename.endswith((".html", ".js", ".css", ".py")):
+                        stat = os.stat(os.path.join(root, filename))
+                        files.append(
+                            (
+                                os.path.relpath(os.path.join(root, filename), Settings.ROOT_DIR),
+                                stat.st_size,
+                                stat.st_mtime_ns,
+                            )
+                        )
+
+        return sorted(files)
@@ -0,0 +1,175 @@
+"""Writers of report files"""
+
+import gzip
+import io
+import os
+import shutil
+import tarfile
+import time
+import zipfile
+from threading import Lock
+from typing import Callable, Dict, List
+
+from fusion_report.common.exceptions.report import ReportException
+
+
+class ReportWriter:
+    """Writes files of the report to the output directory, optionally with pre-compressed
+    siblings (`index.html.gz`, `index.html.br`) served by static web servers as they are.
+
+    Attributes:
+        path: Output directory
+        compressors: Compress content for each extension of the siblings
+    """
+
+    COMPRESSIONS = ("gzip", "br")
+
+    def __init__(self, path: str, compress: List[str] | None = None) -> None:
+        self.path = path
+        self.compressors: Dict[str, Callable[[bytes], bytes]] = {}
+        for compression in compress or []:
+            if compression not in self.COMPRESSIONS:
+                raise ReportException(f"Compression {compression} is not supported")
+            if compression == "gzip":
+                self.compressors[".gz"] = self._gzip
+            else:
+                self.compressors[".br"] = self._brotli()
+
+    def write(self, filename: str, content: str | bytes) -> None:
+        """Writes file of the report, `filename` is relative to the output directory.
+
+        Raises:
+            ReportException
+        """
+        data = content.encode("utf-8") if isinstance(content, str) else content
+        try:
+            os.makedirs(os.path.dirname(os.path.join(self.path, filename)), exist_ok=True)
+            with open(os.path.join(self.path, filename), "wb") as output:
+                output.write(data)
+            for extension, compressor in self.compressors.items():
+                with open(os.path.join(self.path, filename + extension), "wb") as output:
+                    output.write(compressor(data))
+        except IOError as ex:
+            raise ReportException(ex) from ex
+
+    def add(self, filename: str) -> None:
+        """Includes file or directory already written to the output directory in the report.
+
+        Raises:
+            ReportException
+        """
+        if not self.compressors:
+            return
+        for name in self.files(os.path.join(self.path, filename)):
+            with open(name, "rb") as source:
+                self.write(os.path.relpath(name, self.path), source.read())
+
+    def close(self) -> None:
+        """Finishes writing of the report."""
+
+    @staticmethod
+    def files(path: str) -> List[str]:
+        """Returns the file or files of the directory, missing path has no files."""
+        if os.path.isfile(path):
+            return [path]
+        return sorted(
+            os.path.join(root, filename)
+            for root, _, filenames in os.walk(path)
+            for filename in filenames
+        )
+
+    @staticmethod
+    def _gzip(data: bytes) -> bytes:
+        return gzip.compress(data, compresslevel=9, mtime=0)
+
+    @staticmethod
+    def _brotli() -> Callable[[bytes], bytes]:
+        """Returns brotli compressor, requires the optional `brotli` package."""
+        try:
+            import brotli
+        except ImportError as ex:
+            raise ReportException("Brotli compression requires the brotli package") from ex
+
+        return brotli.compress
+
+
+class ArchiveWriter(ReportWriter):
+    """Streams files of the report into a single archive in the output directory instead of
+    writing each of them. Files are added by concurrent workers, so writes are serialized.
+
+    Attributes:
+        archive: Path of the archive
+    """
+
+    FORMATS = ("zip", "tar.gz")
+
+    def __init__(self, path: str, archive_format: str, name: str) -> None:
+        if archive_format not in self.FORMATS:
+            raise ReportException(f"Archive format {archive_format} is not supported")
+        super().__init__(path)
+        self.archive: str = os.path.join(path, f"{name}.{archive_format}")
+        self.__lock = Lock()
+        self.__zip: zipfile.ZipFile | None = None
+        self.__tar: tarfile.TarFile | None = None
+        try:
+            os.makedirs(path, exist_ok=True)
+            if archive_format == "zip":
+                self.__zip = zipfile.ZipFile(self.archive, "w", zipfile.ZIP_DEFLATED)
+            else:
+                self.__tar = tarfile.open(self.archive, "w:gz")
+        except IOError as ex:
+            raise ReportException(ex) from ex
+
+    def write(self, filename: str, content: str | bytes) -> None:
+        """Adds file to the archive.
+
+        Raises:
+            ReportException
+        """
+        data = content.encode("utf-8") if isinstance(content, str) else content
+        with self.__lock:
+            try:
+                if self.__zip is not None:
+                    info = zipfile.ZipInfo(filename, time.localtime()[:6])
+                    info.compress_type = zipfile.ZIP_DEFLATED
+                    self.__zip.writestr(info, data)
+                elif self.__tar is not None:
+                    info = tarfile.TarInfo(filename)
+                    info.size = len(data)
+                    info.mtime = int(time.time())
+                    self.__tar.addfile(info, io.BytesIO(data))
+            except (IOError, ValueError) as ex:
+                raise ReportException(ex) from ex
+
+    def add(self, filename: str) -> None:
+        """Moves file or directory already written to the output directory into the archive.
+
+        Raises:
+            ReportException
+        """
+        path = os.path.join(self.path, filename)
+        for name in self.files(path):
+            with open(name, "rb") as source:
+                self.write(os.path.relpath(name, self.path), source.read())
+        try:
+            if os.path.isdir(path):
+                shutil.rmtree(path)
+            elif os.path.isfile(path):
+                os.remove(path)
+        except IOError as ex:
+            raise ReportException(ex) from ex
+
+    def close(self) -> None:
+        """Finishes the archive.
+
+        Raises:
+            ReportException
+        """
+        with self.__lock:
+            try:
+                if self.__zip is not None:
+                    self.__zip.close()
+                if self.__tar is not None:
+                    self.__tar.close()
+            except IOError as ex:
+                raise ReportException(ex) from ex
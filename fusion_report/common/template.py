@@ -1,13 +1,26 @@
 """Template wrapper"""
 
 import os
+import re
+from functools import partial
+from hashlib import sha256
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List
 
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import (
+    BytecodeCache,
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    pass_context,
+)
+from jinja2.runtime import Context
 from markupsafe import Markup
 
+from fusion_report.common.exceptions.report import ReportException
 from fusion_report.common.page import Page
+from fusion_report.common.report_manifest import ReportManifest
+from fusion_report.common.report_writer import ReportWriter
 from fusion_report.config import Config
 from fusion_report.settings import Settings
 
@@ -19,10 +32,122 @@ class Template:
         j2_env: Jinja2 Environment
         j2_variables: Extra variables from configuration
         output_dir: Output directory where the files will be generated
+        asset_urls: Relative URLs of vendor CSS and JavaScript written to the output directory,
+            keyed by their template path, empty when the assets are inlined in every page
+        context: Variables shared by all pages of the report, computed once
+        manifest: Manifest of the pages written by the previous run, pages are written through
+            it when the report is regenerated incrementally
+        writer: Writer of the report files, output directory by default
+        minify: Minify rendered pages
     """
 
-    def __init__(self, config_path: str, output_dir: str) -> None:
-        self.j2_env = Environment(
+    ASSET_MODES = ("external", "inline")
+    # contents of these elements are not minified by `minify_html`, scripts only lose indentation
+    PRESERVED_ELEMENTS = re.compile(
+        r"(<(pre|textarea|script)\b.*?</\2\s*>)", re.IGNORECASE | re.DOTALL
+    )
+    HTML_COMMENTS = re.compile(r"<!--(?!\[if).*?-->", re.DOTALL)
+
+    def __init__(
+        self,
+        config_path: str,
+        output_dir: str,
+        j2_env: Environment | None = None,
+        j2_variables: Config | None = None,
+        assets: str = "inline",
+        hash_assets: bool = False,
+        writer: ReportWriter | None = None,
+        minify: bool = False,
+    ) -> None:
+        # environment and configuration can be shared by reports of several samples
+        self.j2_env = j2_env or self.create_environment()
+        self.j2_variables: Config = j2_variables or Config().parse(config_path)
+        self.output_dir: str = output_dir
+
+        # Making sure output directory exists
+        if not os.path.exists(output_dir):
+            os.mkdir(output_dir)
+
+        self.writer: ReportWriter = writer or ReportWriter(output_dir)
+        self.minify: bool = minify
+        if assets not in self.ASSET_MODES:
+            raise ReportException(f"Asset mode {assets} is not supported")
+        self.asset_urls: Dict[str, str] = (
+            self.write_assets(hash_assets) if assets == "external" else {}
+        )
+        self.context: Dict[str, Any] = {
+            **self.j2_variables.json_serialize(),
+            "asset_urls": self.asset_urls,
+        }
+        self.manifest: ReportManifest | None = None
+
+    def render(self, page: Page, extra_variables: Dict[str, Any]) -> None:
+        """Renders page"""
+        view = self.j2_env.get_template(page.view).render(self.context, **extra_variables)
+        if self.minify:
+            view = self.minify_html(view)
+        if self.manifest is None or self.manifest.changed(page.filename, view):
+            self.writer.write(page.filename, view)
+
+    @classmethod
+    def minify_html(cls, html: str) -> str:
+        """Removes comments, indentation and blank lines of the page. Line breaks are kept, so
+        inline scripts behave the same, `pre`, `textarea` and `script` contents are only
+        stripped of indentation or kept as they are."""
+        minified: List[str] = []
+        for index, part in enumerate(cls.PRESERVED_ELEMENTS.split(html)):
+            # split yields text, preserved element and its tag name
+            if index % 3 == 0:
+                part = cls.HTML_COMMENTS.sub("", part)
+            elif index % 3 == 2:
+                continue
+            elif not part.lower().startswith("<script"):
+                minified.append(part)
+                continue
+            minified.append("\n".join(line.strip() for line in part.splitlines() if line.strip()))
+
+        return "".join(minified)
+
+    def write_assets(self, hashed: bool = False) -> Dict[str, str]:
+        """Writes vendor CSS and JavaScript once to `assets/` of the output directory, so pages
+        reference them instead of inlining them.
+
+        Args:
+            hashed: add hash of the content to file names, e.g. `main.1a2b3c4d5e.js`, so the
+                files can be cached by browsers and web servers indefinitely
+
+        Returns:
+            Relative URL of each asset keyed by its template path, i.e. `assets/js/main.js`
+
+        Raises:
+            ReportException
+        """
+        asset_urls: Dict[str, str] = {}
+        try:
+            for asset_type in ("css", "js"):
+                source_dir = os.path.join(Settings.ROOT_DIR, "templates", "assets", asset_type)
+                for filename in sorted(os.listdir(source_dir)):
+                    with open(os.path.join(source_dir, filename), "rb") as asset:
+                        content = asset.read()
+                    url = f"assets/{asset_type}/{filename}"
+                    if hashed:
+                        path = Path(filename)
+                        url = (
+                            f"assets/{asset_type}/"
+                            f"{path.stem}.{sha256(content).hexdigest()[:10]}{path.suffix}"
+                        )
+                    self.writer.write(url, content)
+                    asset_urls[f"assets/{asset_type}/{filename}"] = url
+        except IOError as ex:
+            raise ReportException(ex) from ex
+
+        return asset_urls
+
+    @staticmethod
+    def create_environment() -> Environment:
+        """Creates Jinja2 environment with template loaders and helper functions. Templates
+        are not checked for changes once loaded and their compiled code is cached on disk."""
+        j2_env = Environment(
             loader=FileSystemLoader(
                 [
                     os.path.join(Settings.ROOT_DIR, "templates/"),
@@ -31,45 +156,64 @@ class Template:
             ),
             trim_blocks=True,
             autoescape=True,
+            auto_reload=False,
+            bytecode_cache=Template.bytecode_cache(),
         )
-        self.j2_variables: Config = Config().parse(config_path)
-        self.output_dir: str = output_dir
 
         # helper functions which can be used inside partial templates
-        self.j2_env.globals["include_raw"] = self.include_raw
-        self.j2_env.globals["get_id"] = self.get_id
+        j2_env.globals["include_raw"] = partial(Template.render_raw, j2_env)
+        j2_env.globals["include_asset"] = Template.include_asset
+        j2_env.globals["get_id"] = Template.get_id
+        return j2_env
 
-        # Making sure output directory exists
-        if not os.path.exists(output_dir):
-            os.mkdir(output_dir)
-
-    def render(self, page: Page, extra_variables: Dict[str, Any]) -> None:
-        """Renders page"""
-        merged_variables = {**self.j2_variables.json_serialize(), **extra_variables}
-        view = self.j2_env.get_template(page.view).render(merged_variables)
-        with open(os.path.join(self.output_dir, page.filename), "w", encoding="utf-8") as file_out:
-            file_out.write(view)
+    @staticmethod
+    def bytecode_cache() -> BytecodeCache | None:
+        """Returns cache of compiled templates shared by all invocations, stored in
+        `Settings.CACHE_DIR`. Templates are compiled on every invocation when the directory
+        can't be created."""
+        directory = os.path.join(Settings.CACHE_DIR, "templates")
+        try:
+            os.makedirs(directory, exist_ok=True)
+        except OSError:
+            return None
+        return FileSystemBytecodeCache(directory)
 
     def include_raw(self, filename: str) -> Markup:
         """Helper fusion for including raw content in Jinja2, mostly used to include custom
         or vendor javascript and custom css"""
+        return self.render_raw(self.j2_env, filename)
+
+    @staticmethod
+    def render_raw(j2_env: Environment, filename: str) -> Markup:
+        """Returns raw content of the file, css and javascript are wrapped in their tags."""
         file_extension = Path(filename).suffix
-        assert isinstance(self.j2_env.loader, FileSystemLoader)
+        assert isinstance(j2_env.loader, FileSystemLoader)
 
         if file_extension == ".css":
             return Markup(
                 '<style type="text/css">{css}</style>'.format(
-                    css=self.j2_env.loader.get_source(self.j2_env, filename)[0]
+                    css=j2_env.loader.get_source(j2_env, filename)[0]
                 )
             )
         if file_extension == ".js":
             return Markup(
-                "<script>{js}</script>".format(
-                    js=self.j2_env.loader.get_source(self.j2_env, filename)[0]
-                )
+                "<script>{js}</script>".format(js=j2_env.loader.get_source(j2_env, filename)[0])
             )
 
-        return Markup(self.j2_env.loader.get_source(self.j2_env, filename)[0])
+        return Markup(j2_env.loader.get_source(j2_env, filename)[0])
+
+    @staticmethod
+    @pass_context
+    def include_asset(context: Context, filename: str) -> Markup:
+        """Helper function for including vendor javascript and css in Jinja2. Assets written to
+        the output directory are referenced, otherwise they are inlined like `include_raw`."""
+        url = context.get("asset_urls", {}).get(filename)
+        if url is None:
+            return Template.render_raw(context.environment, filename)
+
+        if Path(filename).suffix == ".css":
+            return Markup(f'<link rel="stylesheet" type="text/css" href="{url}">')
+        return Markup(f'<script src="{url}"></script>')
 
     @staticmethod
     def get_id(title: str) -> str:
@@ -0,0 +1,16 @@
+"""Consolidate module"""
+
+from argparse import Namespace
+
+from fusion_report.common.logger import Logger
+from fusion_report.data.annotations import AnnotationsDB
+
+
+class Consolidate:
+    """Class designed for building consolidated annotations database from all downloaded
+    databases. Runs then need only a single database file.
+    """
+
+    def __init__(self, params: Namespace):
+        AnnotationsDB(params.db_path).build(params.db_path)
+        Logger(__name__).info("Consolidating finished")
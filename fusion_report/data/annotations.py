@@ -0,0 +1,195 @@
+"""Consolidated Annotations Database"""
+
+import os
+import sqlite3
+from typing import Any, Dict, List, Tuple
+
+from fusion_report.common.db import Db
+from fusion_report.common.exceptions.db import DbException
+from fusion_report.common.logger import Logger
+from fusion_report.common.singleton import Singleton
+from fusion_report.data.fusion_index import FusionIndex
+from fusion_report.data.mitelman import MitelmanDB
+from fusion_report.settings import Settings
+
+
+class AnnotationsDB(Db, metaclass=Singleton):
+    """Single database consolidating all downloaded fusion databases. Fusions of every source
+    are stored in one table `fusions` with normalized fusion pair, gene partners, source name
+    and source specific attributes (JSON), table `sources` holds version of each source,
+    i.e. the timestamp and the size and modification time of the source database file, and
+    table `codes` descriptions of codes used by the sources, see `Db.get_codes`.
+    """
+
+    table = "fusions"
+
+    def __init__(self, path: str, readonly: bool = False) -> None:
+        super().__init__(
+            path, Settings.ANNOTATIONS["NAME"], Settings.ANNOTATIONS["SCHEMA"], readonly
+        )
+        self._codes: Dict[str, str] | None = None
+
+    @staticmethod
+    def file_name() -> str:
+        """Returns name of the database file."""
+        return f'{Settings.ANNOTATIONS["NAME"].lower()}.db'
+
+    def build(self, path: str) -> None:
+        """Builds database from all fusion databases available in the path.
+
+        Raises:
+            DbException
+        """
+        version = FusionIndex.timestamp(path)
+        self._codes = None
+        try:
+            with self.connection as conn:
+                conn.execute("DROP TABLE IF EXISTS fusions")
+                conn.execute("DROP TABLE IF EXISTS sources")
+                conn.execute("DROP TABLE IF EXISTS codes")
+            indexes = self.create_database(indexes=False)
+            for db_class, settings in FusionIndex.DATABASES:
+                database_file = os.path.join(path, f'{settings["NAME"].lower()}.db')
+                if not os.path.exists(database_file):
+                    continue
+                database = db_class(path)
+                size, mtime_ns = FusionIndex.stat(database_file)
+                attributes = ", ".join(
+                    f"'{column}', {column}" for column in database.attribute_columns
+                )
+                self.connection.execute("ATTACH DATABASE ? AS source", [database_file])
+                try:
+                    with self.connection as conn:
+                        records = conn.execute(
+                            f"""INSERT INTO fusions
+                                SELECT {database.normalized('fusion_pair')},
+                                       {database.normalized('five_prime_partner')},
+                                       {database.normalized('three_prime_partner')},
+                                       ?, json_object({attributes})
+                                FROM source.{database.table}
+                                WHERE {database.normalized('fusion_pair')} != ''""",
+                            [database.name],
+                        ).rowcount
+                        conn.execute(
+                            "INSERT INTO sources VALUES (?, ?, ?, ?, ?)",
+                            [database.name, version, records, size, mtime_ns],
+                        )
+                        conn.executemany(
+                            "INSERT INTO codes VALUES (?, ?, ?)",
+                            [
+                                (database.name, code, description)
+                                for code, description in database.get_codes().items()
+                            ],
+                        )
+                finally:
+                    self.connection.execute("DETACH DATABASE source")
+                Logger(__name__).info("Added %s records of %s", records, database.name)
+            with self.connection as conn:
+                for index in indexes:
+                    conn.execute(index)
+            self.connection.execute("ANALYZE")
+            self.connection.commit()
+        except sqlite3.Error as ex:
+            raise DbException(ex) from ex
+
+    def get_sources(self) -> Dict[str, str]:
+        """Returns version of all sources."""
+        return dict(self.select_rows("SELECT source, version FROM sources"))
+
+    def outdated(self, path: str, sources: List[str]) -> List[str]:
+        """Returns sources missing in the database or changed since the database was built,
+        i.e. the timestamp or the source database file is different. Source database files
+        and the timestamp are checked only when available, the database can be distributed
+        without them.
+        """
+        try:
+            built: Dict[str, Tuple[str, int, int]] = {
+                source: (version, size, mtime_ns)
+                for source, version, size, mtime_ns in self.select_rows(
+                    "SELECT source, version, size, mtime_ns FROM sources"
+                )
+            }
+        except DbException:
+            # built by an older version
+            return list(sources)
+
+        timestamp = FusionIndex.timestamp(path)
+        outdated: List[str] = []
+        for source in sources:
+            database_file = os.path.join(path, f"{source.lower()}.db")
+            entry = built.get(source)
+            if (
+                entry is None
+                or (timestamp and entry[0] != timestamp)
+                or (os.path.exists(database_file) and entry[1:] != FusionIndex.stat(database_file))
+            ):
+                outdated.append(source)
+
+        return outdated
+
+    def get_all_fusions(self, sources: List[str]) -> Dict[str, List[str]]:
+        """Returns all fusions of the sources in a single query.
+
+        Returns:
+            Fusions of each source keyed by source name, in order of `sources`
+        """
+        local_fusions: Dict[str, List[str]] = {source: [] for source in sources}
+        query: str = f"""SELECT DISTINCT source, fusion_pair
+                         FROM fusions
+                         WHERE source IN ({', '.join(['?' for _ in sources])})"""
+        for source, fusion_pair in self.select_rows(query, sources):
+            local_fusions[source].append(fusion_pair)
+
+        return local_fusions
+
+    def get_annotations(
+        self, fusion_pairs: List[str], sources: List[str] | None = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """Returns annotations of the fusions from records of the sources in a single query.
+
+        Returns:
+            PubMed IDs, cancer types, COSMIC phenotype IDs and Mitelman cases keyed by fusion
+            pair, fusions without any record are missing
+        """
+        if not fusion_pairs:
+            return {}
+        sources = sources or list(self.get_sources())
+        query: str = f"""SELECT fusion_pair,
+                                group_concat(DISTINCT
+                                    nullif(json_extract(attributes, '$.pubmed_pmid'), '')),
+                                group_concat(DISTINCT
+                                    nullif(json_extract(attributes, '$.morph'), '')),
+                                group_concat(DISTINCT
+                                    nullif(json_extract(attributes, '$.cosmic_phenotype_id'), '')),
+                                count(DISTINCT CASE WHEN source = ?
+                                    THEN json_extract(attributes, '$.refno') || ':'
+                                         || json_extract(attributes, '$.invno') END)
+                         FROM fusions
+                         WHERE source IN ({', '.join(['?' for _ in sources])})
+                               AND fusion_pair IN ({', '.join(['?' for _ in fusion_pairs])})
+                         GROUP BY fusion_pair"""
+        return {
+            fusion_pair: {
+                "pubmed": pubmed,
+                "cancer_types": MitelmanDB.describe(morphology, self.get_codes()),
+                "cosmic_phenotype_ids": phenotypes,
+                "mitelman_cases": cases,
+            }
+            for fusion_pair, pubmed, morphology, phenotypes, cases in self.select_rows(
+                query, [Settings.MITELMAN["NAME"], *sources, *fusion_pairs]
+            )
+        }
+
+    def get_codes(self) -> Dict[str, str]:
+        """Returns descriptions of Mitelman morphology codes, nothing when the database was
+        built by an older version without the table `codes`."""
+        if self._codes is None:
+            self._codes = {}
+            if self.columns("codes"):
+                self._codes = dict(
+                    self.select_rows(
+                        "SELECT code, description FROM codes WHERE source = ?",
+                        [Settings.MITELMAN["NAME"]],
+                    )
+                )
+        return self._codes
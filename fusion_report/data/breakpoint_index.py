@@ -0,0 +1,194 @@
+"""COSMIC breakpoint interval index"""
+
+import json
+import os
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, List, Set, Tuple
+
+from fusion_report.common.exceptions.db import DbException
+from fusion_report.common.logger import Logger
+from fusion_report.data.cosmic import CosmicDB
+from fusion_report.data.fusion_index import FusionIndex
+from fusion_report.settings import Settings
+
+# interval of a breakpoint: chromosome, start, end
+Breakpoint = Tuple[str, int, int]
+
+
+class BreakpointIndex:
+    """Per-chromosome interval index of fusion breakpoints catalogued in COSMIC.
+
+    The 5' breakpoint of an event is the stop of the 5' partner (`FIVE_PRIME_GENOME_STOP_FROM`
+    to `FIVE_PRIME_GENOME_STOP_TO`) and the 3' breakpoint the start of the 3' partner
+    (`THREE_PRIME_GENOME_START_FROM` to `THREE_PRIME_GENOME_START_TO`). Events of a chromosome
+    are split into buckets by length of the 5' breakpoint interval (powers of two) and sorted by
+    its start. A lookup bisects in each bucket the candidates whose interval can reach the called
+    breakpoint and compares their 3' breakpoint. Intervals of a bucket differ in length less than
+    twice, so a few long intervals don't widen the search of all the others and a lookup costs
+    O(b log n) plus the candidates overlapping the breakpoint, b being the number of buckets.
+
+    Attributes:
+        chromosomes: Buckets of events of each chromosome of the 5' breakpoint, columns `start`,
+            `end`, `partner_chromosome`, `partner_start`, `partner_end` and `fusion`, sorted by
+            `start`
+        max_length: Length of the longest 5' breakpoint interval of each bucket
+    """
+
+    VERSION: int = 2
+    COLUMNS = ("start", "end", "partner_chromosome", "partner_start", "partner_end", "fusion")
+
+    def __init__(
+        self, chromosomes: Dict[str, List[Dict[str, List[Any]]]], max_length: Dict[str, List[int]]
+    ) -> None:
+        self.chromosomes = chromosomes
+        self.max_length = max_length
+
+    @classmethod
+    def create(cls, database: CosmicDB) -> "BreakpointIndex":
+        """Creates index from breakpoints of the COSMIC database."""
+        query: str = f"""SELECT five_prime_chromosome,
+                                five_prime_genome_stop_from, five_prime_genome_stop_to,
+                                three_prime_chromosome,
+                                three_prime_genome_start_from, three_prime_genome_start_to,
+                                {database.normalized('fusion_pair')}
+                         FROM {database.table}"""
+        # events keyed by chromosome and length class of the 5' breakpoint interval
+        events: Dict[str, Dict[int, List[Tuple[int, int, str, int, int, str]]]] = {}
+        for row in database.select_rows(query):
+            five_prime = cls.interval(row[0], row[1], row[2])
+            three_prime = cls.interval(row[3], row[4], row[5])
+            if five_prime and three_prime:
+                length = five_prime[2] - five_prime[1]
+                events.setdefault(five_prime[0], {}).setdefault(length.bit_length(), []).append(
+                    (five_prime[1], five_prime[2], *three_prime, row[6])
+                )
+
+        chromosomes: Dict[str, List[Dict[str, List[Any]]]] = {}
+        max_length: Dict[str, List[int]] = {}
+        for chromosome, buckets in events.items():
+            chromosomes[chromosome] = []
+            max_length[chromosome] = []
+            for length_class in sorted(buckets):
+                bucket = sorted(set(buckets[length_class]))
+                chromosomes[chromosome].append(
+                    {
+                        column: [event[index] for event in bucket]
+                        for index, column in enumerate(cls.COLUMNS)
+                    }
+                )
+                max_length[chromosome].append(max(end - start for start, end, *_ in bucket))
+
+        return cls(chromosomes, max_length)
+
+    @classmethod
+    def build(cls, path: str) -> None:
+        """Builds the index from COSMIC database in the path and stores it next to it.
+
+        Raises:
+            DbException
+        """
+        if not os.path.exists(os.path.join(path, f'{Settings.COSMIC["NAME"].lower()}.db')):
+            return
+        database = CosmicDB(path)
+        index = cls.create(database)
+        header = {
+            "version": cls.VERSION,
+            "timestamp": FusionIndex.timestamp(path),
+            "source": FusionIndex.stat(os.path.join(path, database.database)),
+        }
+        try:
+            with open(os.path.join(path, Settings.BREAKPOINT_INDEX), "w", encoding="utf-8") as out:
+                json.dump(
+                    {**header, "chromosomes": index.chromosomes, "max_length": index.max_length},
+                    out,
+                )
+        except IOError as ex:
+            raise DbException(ex) from ex
+        Logger(__name__).info(
+            "Index of %s COSMIC breakpoints built",
+            sum(len(x["start"]) for buckets in index.chromosomes.values() for x in buckets),
+        )
+
+    @classmethod
+    def load(cls, path: str, database: CosmicDB) -> "BreakpointIndex":
+        """Loads the index stored next to the database, the index is created from the database
+        when it is missing or stale."""
+        source = os.path.join(path, database.database)
+        try:
+            with open(
+                os.path.join(path, Settings.BREAKPOINT_INDEX), "r", encoding="utf-8"
+            ) as index:
+                content = json.load(index)
+            if (
+                content["version"] == cls.VERSION
+                and content["timestamp"] == FusionIndex.timestamp(path)
+                and tuple(content["source"]) == FusionIndex.stat(source)
+            ):
+                return cls(content["chromosomes"], content["max_length"])
+        except (IOError, ValueError, KeyError):
+            pass
+
+        Logger(__name__).info("Index of COSMIC breakpoints not found or outdated, using database")
+        return cls.create(database)
+
+    def match(self, position: str, tolerance: int = 0) -> Set[str]:
+        """Finds catalogued events of the called breakpoint pair.
+
+        Args:
+            position: breakpoints reported by a tool, `chr:pos[:strand]#chr:pos[:strand]`,
+                position can be a range `start-end`
+            tolerance: maximal distance of called and catalogued breakpoints
+
+        Returns:
+            Fusions of the events where both breakpoints are within tolerance
+        """
+        breakpoints = [self.breakpoint(side) for side in (position or "").split("#")]
+        if len(breakpoints) != 2 or not breakpoints[0] or not breakpoints[1]:
+            return set()
+        (chromosome, start, end), (partner_chromosome, partner_start, partner_end) = breakpoints
+        fusions: Set[str] = set()
+        for events, max_length in zip(
+            self.chromosomes.get(chromosome, []), self.max_length.get(chromosome, [])
+        ):
+            # candidates start at most `max_length` of the bucket before the breakpoint
+            first = bisect_left(events["start"], start - tolerance - max_length)
+            last = bisect_right(events["start"], end + tolerance)
+            fusions.update(
+                events["fusion"][index]
+                for index in range(first, last)
+                if events["end"][index] + tolerance >= start
+                and events["partner_chromosome"][index] == partner_chromosome
+                and events["partner_start"][index] - tolerance <= partner_end
+                and events["partner_end"][index] + tolerance >= partner_start
+            )
+
+        return fusions
+
+    @staticmethod
+    def breakpoint(value: str) -> Breakpoint | None:
+        """Parses breakpoint `chr:pos[:strand]` or `chr:start-end[:strand]`."""
+        parts = value.strip().split(":")
+        if len(parts) < 2:
+            return None
+        try:
+            start, _, end = parts[1].partition("-")
+            return BreakpointIndex.chromosome(parts[0]), int(start), int(end or start)
+        except ValueError:
+            return None
+
+    @staticmethod
+    def interval(chromosome: Any, start: Any, end: Any) -> Breakpoint | None:
+        """Returns interval of a catalogued breakpoint, None when coordinates are missing."""
+        try:
+            start, end = int(start), int(end or start)
+        except (TypeError, ValueError):
+            return None
+        if not chromosome:
+            return None
+        return BreakpointIndex.chromosome(str(chromosome)), min(start, end), max(start, end)
+
+    @staticmethod
+    def chromosome(name: str) -> str:
+        """Returns chromosome name without `chr` prefix."""
+        name = name.strip()
+        return name[3:] if name.lower().startswith("chr") else name
@@ -1,6 +1,5 @@
 """Cosmic Database"""
 
-import re
 from typing import List
 
 from fusion_report.common.db import Db
@@ -8,21 +7,52 @@ from fusion_report.common.singleton import Singleton
 from fusion_report.settings import Settings
 
 
+def _parenthesised(column: str) -> str:
+    """Returns SQL expression extracting the first parenthesised value of the column."""
+    start = f"instr({column}, '(')"
+    length = f"instr(substr({column}, {start}), ')')"
+    return (
+        f"CASE WHEN {start} > 0 AND {length} > 0 "
+        f"THEN substr({column}, {start} + 1, {length} - 2) ELSE '' END"
+    )
+
+
+_FIVE_PRIME = _parenthesised("five_prime_gene_symbol")
+_THREE_PRIME = _parenthesised("three_prime_gene_symbol")
+
+
 class CosmicDB(Db, metaclass=Singleton):
     """Implementation of Cosmic Database. All core functionality is handled by parent class."""
 
-    def __init__(self, path: str) -> None:
-        super().__init__(path, Settings.COSMIC["NAME"], Settings.COSMIC["SCHEMA"])
+    table = "cosmic_fusion_v101_grch38"
+    normalized_columns = {
+        "five_prime_partner": _FIVE_PRIME,
+        "three_prime_partner": _THREE_PRIME,
+        "fusion_pair": (
+            f"CASE WHEN ({_FIVE_PRIME}) != '' AND ({_THREE_PRIME}) != '' "
+            f"THEN ({_FIVE_PRIME}) || '--' || ({_THREE_PRIME}) "
+            f"ELSE ({_FIVE_PRIME}) || ({_THREE_PRIME}) END"
+        ),
+    }
+
+    attribute_columns = [
+        "cosmic_fusion_id",
+        "sample_name",
+        "cosmic_phenotype_id",
+        "fusion_type",
+        "pubmed_pmid",
+    ]
+    annotation_columns = {
+        "pubmed": "group_concat(DISTINCT nullif(pubmed_pmid, ''))",
+        "cosmic_phenotype_ids": "group_concat(DISTINCT nullif(cosmic_phenotype_id, ''))",
+    }
+
+    def __init__(self, path: str, readonly: bool = False) -> None:
+        super().__init__(path, Settings.COSMIC["NAME"], Settings.COSMIC["SCHEMA"], readonly)
 
     def get_all_fusions(self) -> List[str]:
         """Returns all fusions from database."""
-        query: str = '''SELECT DISTINCT
-                            FIVE_PRIME_GENE_SYMBOL || '--' || THREE_PRIME_GENE_SYMBOL AS fusion_pair
-                        FROM cosmic_fusion_v101_grch38
-                        WHERE fusion_pair != ""'''
-        res = self.select(query)
-
-        return [
-            "--".join(re.findall(r"\(.*?\)", x["fusion_pair"])).replace("(", "").replace(")", "")
-            for x in res
-        ]
+        query: str = f"""SELECT DISTINCT {self.normalized('fusion_pair')} AS fusion_pair
+                         FROM {self.table}
+                         WHERE fusion_pair != ''"""
+        return self.select_column(query)
@@ -0,0 +1,118 @@
+"""Annotations of reported fusions"""
+
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Tuple
+
+from fusion_report.common.db import Db
+from fusion_report.settings import Settings
+
+# annotations of a fusion: pubmed, cancer_types, cosmic_phenotype_ids, mitelman_cases
+Annotation = Dict[str, Any]
+
+
+class FusionAnnotations:
+    """Fetches PubMed IDs, cancer types, COSMIC phenotype IDs and Mitelman case counts of the
+    reported fusions from local databases. All fusions are fetched upfront in a few batched
+    queries instead of one query per fusion page. Fetched annotations are kept in an in-process
+    LRU cache shared by all instances, keyed by database folder, its timestamp and enabled
+    sources, so samples of a batch query only fusions not seen before.
+
+    Attributes:
+        databases: Databases providing annotations, see `Db.get_annotations`
+        sources: Names of the enabled databases
+        version: Database folder, its timestamp and enabled sources
+    """
+
+    _cache: "OrderedDict[Tuple[str, str, str, str], Annotation]" = OrderedDict()
+
+    def __init__(
+        self, databases: List[Db], sources: List[str], path: str, timestamp: str | None
+    ) -> None:
+        self.databases = databases
+        self.sources = sources
+        self.version: Tuple[str, str, str] = (path, timestamp or "", ",".join(sources))
+
+    def fetch(
+        self, fusions: Iterable[str], match_reversed: bool | None = None
+    ) -> Dict[str, Annotation]:
+        """Fetches annotations of the fusions, fusions missing in the cache are queried in
+        batches of `Settings.ANNOTATION_BATCH_SIZE`.
+
+        Args:
+            fusions: Fusion names in format GENEA--GENEB
+            match_reversed: include annotations of fusions with reversed partners
+
+        Returns:
+            Annotations keyed by fusion name, fusions without annotations are missing
+        """
+        fusion_pairs: Dict[str, List[str]] = {
+            fusion: self.fusion_pairs(fusion, match_reversed) for fusion in fusions
+        }
+        missing = list(
+            dict.fromkeys(
+                fusion_pair
+                for pairs in fusion_pairs.values()
+                for fusion_pair in pairs
+                if (*self.version, fusion_pair) not in self._cache
+            )
+        )
+        for start in range(0, len(missing), Settings.ANNOTATION_BATCH_SIZE):
+            end = start + Settings.ANNOTATION_BATCH_SIZE
+            self.__query(missing[start:end])
+
+        annotations: Dict[str, Annotation] = {}
+        for fusion, pairs in fusion_pairs.items():
+            annotation = self.merge([self.__cached(fusion_pair) for fusion_pair in pairs])
+            if annotation:
+                annotations[fusion] = annotation
+
+        return annotations
+
+    def __query(self, fusion_pairs: List[str]) -> None:
+        """Queries annotations of the fusion pairs in all databases and caches them, fusion
+        pairs without annotations are cached as well."""
+        results: List[Dict[str, Annotation]] = [
+            database.get_annotations(fusion_pairs, self.sources) for database in self.databases
+        ]
+        for fusion_pair in fusion_pairs:
+            self._cache[(*self.version, fusion_pair)] = self.merge(
+                [result[fusion_pair] for result in results if fusion_pair in result]
+            )
+        while len(self._cache) > Settings.ANNOTATION_CACHE_SIZE:
+            self._cache.popitem(last=False)
+
+    def __cached(self, fusion_pair: str) -> Annotation:
+        """Returns cached annotations of the fusion pair and marks them as recently used."""
+        key = (*self.version, fusion_pair)
+        if key not in self._cache:
+            # evicted by the current fetch
+            self.__query([fusion_pair])
+        self._cache.move_to_end(key)
+        return self._cache[key]
+
+    @staticmethod
+    def merge(annotations: List[Annotation]) -> Annotation:
+        """Merges annotations of several databases or fusion pairs. Comma separated values and
+        lists are turned into sorted lists of unique values and case counts are summed."""
+        merged: Annotation = {}
+        for annotation in annotations:
+            for key, value in annotation.items():
+                if not value:
+                    continue
+                if isinstance(value, int):
+                    merged[key] = merged.get(key, 0) + value
+                else:
+                    values = value.split(",") if isinstance(value, str) else value
+                    merged[key] = sorted(set(merged.get(key, [])).union(values))
+
+        return merged
+
+    @staticmethod
+    def fusion_pairs(fusion: str, match_reversed: bool | None = None) -> List[str]:
+        """Returns fusion pairs of the fusion as stored in the databases."""
+        fusion_pairs = [fusion]
+        partners = fusion.split("--")
+        if match_reversed and len(partners) == 2 and partners[0] != partners[1]:
+            fusion_pairs.append(f"{partners[1]}--{partners[0]}")
+
+        return fusion_pairs
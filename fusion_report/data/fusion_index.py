@@ -0,0 +1,117 @@
+"""Known fusion lookup index"""
+
+import json
+import os
+from typing import Dict, List, Set, Tuple
+
+from fusion_report.common.db import Db
+from fusion_report.common.exceptions.db import DbException
+from fusion_report.common.logger import Logger
+from fusion_report.data.cosmic import CosmicDB
+from fusion_report.data.fusiongdb2 import FusionGDB2
+from fusion_report.data.mitelman import MitelmanDB
+from fusion_report.settings import Settings
+
+
+class FusionIndex:
+    """Precomputed lookup table of all fusions found in local databases. The index is built
+    after the databases are downloaded and stored next to them, so the run doesn't need to
+    scan the databases.
+
+    The file starts with a JSON header line describing the version, databases and source files,
+    followed by one membership byte per fusion (bit `i` set when the fusion is found in `i`-th
+    database) and the sorted fusion names separated by new lines. Index is considered stale when
+    the timestamp or any of the source database files changed.
+    """
+
+    VERSION: int = 1
+    DATABASES = (
+        (CosmicDB, Settings.COSMIC),
+        (MitelmanDB, Settings.MITELMAN),
+        (FusionGDB2, Settings.FUSIONGDB2),
+    )
+
+    @classmethod
+    def build(cls, path: str) -> None:
+        """Builds the index from all databases available in the path.
+
+        Raises:
+            DbException
+        """
+        databases: List[str] = []
+        sources: Dict[str, Tuple[int, int]] = {}
+        members: Dict[str, int] = {}
+        for db_class, settings in cls.DATABASES:
+            # connecting to a missing database would create an empty one
+            if not os.path.exists(os.path.join(path, f'{settings["NAME"].lower()}.db')):
+                continue
+            database = db_class(path)
+            bit = 1 << len(databases)
+            for fusion in database.get_all_fusions():
+                members[fusion] = members.get(fusion, 0) | bit
+            databases.append(database.name)
+            sources[database.name] = cls.stat(os.path.join(path, database.database))
+
+        names = sorted(members)
+        header = {
+            "version": cls.VERSION,
+            "timestamp": cls.timestamp(path),
+            "databases": databases,
+            "sources": sources,
+            "count": len(names),
+        }
+        try:
+            with open(os.path.join(path, Settings.FUSION_INDEX), "wb") as index:
+                index.write(json.dumps(header).encode("utf-8") + b"\n")
+                index.write(bytes(members[name] for name in names))
+                index.write("\n".join(names).encode("utf-8"))
+        except IOError as ex:
+            raise DbException(ex) from ex
+        Logger(__name__).info("Index of %s known fusions built", len(names))
+
+    @classmethod
+    def load(cls, path: str, databases: List[Db]) -> Dict[str, Set[str]] | None:
+        """Loads fusions of the databases from the index.
+
+        Returns:
+            Fusions of each database keyed by database name or None when the index is missing,
+            stale or doesn't cover all databases
+        """
+        try:
+            with open(os.path.join(path, Settings.FUSION_INDEX), "rb") as index:
+                header = json.loads(index.readline())
+                if header["version"] != cls.VERSION or header["timestamp"] != cls.timestamp(path):
+                    return None
+                for database in databases:
+                    source = header["sources"].get(database.name)
+                    if source is None or tuple(source) != cls.stat(
+                        os.path.join(path, database.database)
+                    ):
+                        return None
+                bits = index.read(header["count"])
+                names = index.read().decode("utf-8").split("\n") if header["count"] else []
+        except (IOError, ValueError, KeyError):
+            return None
+
+        local_fusions: Dict[str, Set[str]] = {}
+        for database in databases:
+            bit = 1 << header["databases"].index(database.name)
+            local_fusions[database.name] = {
+                name for name, member in zip(names, bits) if member & bit
+            }
+        return local_fusions
+
+    @staticmethod
+    def stat(file_path: str) -> Tuple[int, int]:
+        """Returns size and modification time of a file, used to validate derived indexes."""
+        stat = os.stat(file_path)
+        return stat.st_size, stat.st_mtime_ns
+
+    @staticmethod
+    def timestamp(path: str) -> str:
+        """Returns content of the timestamp file created at database download."""
+        try:
+            with open(os.path.join(path, "DB-timestamp.txt"), "r", encoding="utf-8") as timestamp:
+                return timestamp.read().strip()
+        except IOError:
+            return ""
@@ -6,17 +6,24 @@ from fusion_report.common.db import Db
 from fusion_report.common.singleton import Singleton
 from fusion_report.settings import Settings
 
+_FUSION_PAIR = "trim(fusions, char(32, 9, 10, 13))"
+
 
 class FusionGDB2(Db, metaclass=Singleton):
     """Implementation of FusionGDB2 Database. All core functionality is handled by parent class."""
 
-    def __init__(self, path: str) -> None:
-        super().__init__(path, Settings.FUSIONGDB2["NAME"], Settings.FUSIONGDB2["SCHEMA"])
+    table = "fusiongdb2"
+    normalized_columns = {
+        "fusion_pair": _FUSION_PAIR,
+        **Db.partners(f"({_FUSION_PAIR})"),
+    }
+
+    def __init__(self, path: str, readonly: bool = False) -> None:
+        super().__init__(path, Settings.FUSIONGDB2["NAME"], Settings.FUSIONGDB2["SCHEMA"], readonly)
 
     def get_all_fusions(self) -> List[str]:
         """Returns all fusions from database."""
-        query: str = """SELECT DISTINCT fusions
-                        FROM fusiongdb2"""
-        res = self.select(query)
-
-        return [fusion["fusions"].strip() for fusion in res]
+        query: str = f"""SELECT DISTINCT {self.normalized('fusion_pair')} AS fusion_pair
+                         FROM {self.table}
+                         WHERE fusion_pair != ''"""
+        return self.select_column(query)
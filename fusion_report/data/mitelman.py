@@ -1,21 +1,74 @@
 """Mitelman Database"""
 
-from typing import List
+from typing import Any, Dict, List
 
 from fusion_report.common.db import Db
 from fusion_report.common.singleton import Singleton
 from fusion_report.settings import Settings
 
+_FUSION_PAIR = (
+    "CASE WHEN geneshort LIKE '%::%' "
+    "THEN replace(trim(geneshort, char(32, 9, 10, 13)), '::', '--') ELSE '' END"
+)
+
 
 class MitelmanDB(Db, metaclass=Singleton):
-    """Implementation of Mitelman Database. All core functionality is handled by parent class."""
+    """Implementation of Mitelman Database. All core functionality is handled by parent class,
+    morphology codes of the cases are translated to descriptions of table `koder`."""
+
+    table = "mbca"
+    normalized_columns = {
+        "fusion_pair": _FUSION_PAIR,
+        **Db.partners(f"({_FUSION_PAIR})"),
+    }
+
+    attribute_columns = ["refno", "invno", "morph", "topo"]
+    annotation_columns = {
+        "cancer_types": "group_concat(DISTINCT nullif(morph, ''))",
+        "mitelman_cases": "count(DISTINCT refno || ':' || invno)",
+    }
+
+    def __init__(self, path: str, readonly: bool = False) -> None:
+        super().__init__(path, Settings.MITELMAN["NAME"], Settings.MITELMAN["SCHEMA"], readonly)
+        self._codes: Dict[str, str] | None = None
 
-    def __init__(self, path: str) -> None:
-        super().__init__(path, Settings.MITELMAN["NAME"], Settings.MITELMAN["SCHEMA"])
+    def get_codes(self) -> Dict[str, str]:
+        """Returns descriptions of morphology codes, nothing when the database was downloaded
+        by an older version without the code translation table."""
+        if self._codes is None:
+            self._codes = {}
+            if self.columns("koder"):
+                self._codes = {
+                    code.strip(): description.strip()
+                    for code, description in self.select_rows(
+                        "SELECT kod, benamning FROM koder WHERE kodtyp = 'M' AND benamning != ''"
+                    )
+                }
+        return self._codes
+
+    def get_annotations(
+        self, fusion_pairs: List[str], sources: List[str] | None = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """Returns annotations of the fusions, cancer types are descriptions of the morphology
+        codes, see `Db.get_annotations`."""
+        annotations = super().get_annotations(fusion_pairs, sources)
+        for annotation in annotations.values():
+            annotation["cancer_types"] = self.describe(annotation["cancer_types"], self.get_codes())
+        return annotations
+
+    @staticmethod
+    def describe(morphology: str | None, codes: Dict[str, str]) -> List[str]:
+        """Returns descriptions of comma separated morphology codes, codes without description
+        are kept."""
+        return [
+            codes.get(code.strip(), code.strip())
+            for code in (morphology or "").split(",")
+            if code.strip()
+        ]
 
     def get_all_fusions(self) -> List[str]:
         """Returns all fusions from database."""
-        query: str = '''SELECT DISTINCT geneshort FROM mbca WHERE geneshort LIKE "%::%"'''
-        res = self.select(query)
-
-        return [fusion["geneshort"].strip().replace("::", "--") for fusion in res]
+        query: str = f"""SELECT DISTINCT {self.normalized('fusion_pair')} AS fusion_pair
+                         FROM {self.table}
+                         WHERE fusion_pair != ''"""
+        return self.select_column(query)
@@ -0,0 +1,24 @@
+CREATE TABLE "sources" (
+	"source" varchar(50) NOT NULL PRIMARY KEY,
+	"version" varchar(50) NOT NULL DEFAULT '',
+	"records" integer NOT NULL DEFAULT 0,
+	"size" integer NOT NULL DEFAULT 0,
+	"mtime_ns" integer NOT NULL DEFAULT 0
+);
+CREATE TABLE "codes" (
+	"source" varchar(50) NOT NULL DEFAULT '',
+	"code" varchar(50) NOT NULL DEFAULT '',
+	"description" varchar(255) NOT NULL DEFAULT '',
+	PRIMARY KEY ("source", "code")
+);
+CREATE TABLE "fusions" (
+	"fusion_pair" varchar(255) NOT NULL DEFAULT '',
+	"gene5" varchar(255) NOT NULL DEFAULT '',
+	"gene3" varchar(255) NOT NULL DEFAULT '',
+	"source" varchar(50) NOT NULL DEFAULT '',
+	"attributes" TEXT NOT NULL DEFAULT '{}'
+);
+CREATE INDEX annotations_fusion_pair_index ON fusions(fusion_pair, source);
+CREATE INDEX annotations_source_index ON fusions(source, fusion_pair);
+CREATE INDEX annotations_gene5_index ON fusions(gene5, fusion_pair);
+CREATE INDEX annotations_gene3_index ON fusions(gene3, fusion_pair);
@@ -23,5 +23,11 @@ CREATE TABLE "cosmic_fusion_v101_grch38" (
     "THREE_PRIME_GENOME_STOP_FROM" varchar(50) NOT NULL DEFAULT '',
     "THREE_PRIME_GENOME_STOP_TO" varchar(50) NOT NULL DEFAULT '',
     "FUSION_TYPE" varchar(50) NOT NULL DEFAULT '',
-    "PUBMED_PMID" varchar(50) NOT NULL DEFAULT ''
+    "PUBMED_PMID" varchar(50) NOT NULL DEFAULT '',
+    "FIVE_PRIME_PARTNER" varchar(50) NOT NULL DEFAULT '',
+    "THREE_PRIME_PARTNER" varchar(50) NOT NULL DEFAULT '',
+    "FUSION_PAIR" varchar(100) NOT NULL DEFAULT ''
 );
+CREATE INDEX cosmic_fusion_pair_index ON cosmic_fusion_v101_grch38(FUSION_PAIR);
+CREATE INDEX cosmic_five_prime_partner_index ON cosmic_fusion_v101_grch38(FIVE_PRIME_PARTNER, FUSION_PAIR);
+CREATE INDEX cosmic_three_prime_partner_index ON cosmic_fusion_v101_grch38(THREE_PRIME_PARTNER, FUSION_PAIR);
@@ -1,3 +1,9 @@
 CREATE TABLE "fusiongdb2" (
-	"fusions" varchar(50) NOT NULL DEFAULT ''
+	"fusions" varchar(50) NOT NULL DEFAULT '',
+	"five_prime_partner" varchar(50) NOT NULL DEFAULT '',
+	"three_prime_partner" varchar(50) NOT NULL DEFAULT '',
+	"fusion_pair" varchar(50) NOT NULL DEFAULT ''
 );
+CREATE INDEX fusiongdb2_fusion_pair_index ON fusiongdb2(fusion_pair);
+CREATE INDEX fusiongdb2_five_prime_partner_index ON fusiongdb2(five_prime_partner, fusion_pair);
+CREATE INDEX fusiongdb2_three_prime_partner_index ON fusiongdb2(three_prime_partner, fusion_pair);
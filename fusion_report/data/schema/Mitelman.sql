@@ -10,5 +10,19 @@ CREATE TABLE "MBCA" (
 	"genelong" varchar2(4000) NULL ,
 	"karylength" smallint NULL ,
 	"karyshort" varchar (255) NULL ,
-	"karylong" varchar2(4000) NULL
+	"karylong" varchar2(4000) NULL,
+	"five_prime_partner" varchar (255) NOT NULL DEFAULT '',
+	"three_prime_partner" varchar (255) NOT NULL DEFAULT '',
+	"fusion_pair" varchar (255) NOT NULL DEFAULT ''
 );
+CREATE TABLE "KODER" (
+	"kod" varchar (20) NOT NULL ,
+	"kodtyp" char (1) NOT NULL ,
+	"benamning" varchar (255) NULL ,
+	"kortnamn" varchar (255) NULL ,
+	"giltig" char (1) NULL
+);
+CREATE INDEX mitelman_fusion_pair_index ON MBCA(fusion_pair);
+CREATE INDEX mitelman_five_prime_partner_index ON MBCA(five_prime_partner, fusion_pair);
+CREATE INDEX mitelman_three_prime_partner_index ON MBCA(three_prime_partner, fusion_pair);
+CREATE INDEX mitelman_koder_index ON KODER(kodtyp, kod);
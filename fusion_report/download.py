@@ -7,6 +7,9 @@ from typing import List
 from fusion_report.common.exceptions.download import DownloadException
 from fusion_report.common.logger import Logger
 from fusion_report.common.net import Net
+from fusion_report.data.annotations import AnnotationsDB
+from fusion_report.data.breakpoint_index import BreakpointIndex
+from fusion_report.data.fusion_index import FusionIndex
 
 
 class Download:
@@ -70,3 +73,11 @@ class Download:
 
         # Create timestamp:
         Net.timestamp()
+
+        # Index of known fusions used by the run, next to the databases
+        FusionIndex.build(".")
+        BreakpointIndex.build(".")
+
+        # existing consolidated database would hold the replaced databases
+        if params.annotations_db or os.path.exists(AnnotationsDB.file_name()):
+            AnnotationsDB(".").build(".")
@@ -0,0 +1,14 @@
+"""Fusion detail module"""
+
+from typing import Any, Dict
+
+from fusion_report.modules.base_module import BaseModule
+
+
+class CustomModule(BaseModule):
+    """Fusion detail section of the single page report, fusions are rendered by the browser
+    from the report data file"""
+
+    def load(self) -> Dict[str, Any]:
+        """Return module variables."""
+        return {"data_file": self.params["data_file"], "menu": []}
@@ -10,4 +10,8 @@ class CustomModule(BaseModule):
 
     def load(self) -> Dict[str, Any]:
         """Return module variables."""
-        return {"fusion": self.params["fusion"], "menu": ["Summary"]}
+        return {
+            "fusion": self.params["fusion"],
+            "annotations": self.params.get("annotations", {}),
+            "menu": ["Summary"],
+        }
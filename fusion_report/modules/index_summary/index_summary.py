@@ -1,6 +1,12 @@
-from typing import Any, Dict, List
+import glob
+import json
+import os
+from typing import Any, Dict, Iterable, Iterator, List
 
+from fusion_report.common.exceptions.module import ModuleException
+from fusion_report.common.models.fusion import Fusion
 from fusion_report.modules.base_module import BaseModule
+from fusion_report.settings import Settings
 
 
 class CustomModule(BaseModule):
@@ -10,7 +16,7 @@ class CustomModule(BaseModule):
         Returns:
             List of known and unknown fusions found in local databases, i.e: ['known': 10, ...]
         """
-        all_fusions: int = len(self.manager.fusions)
+        all_fusions: int = len(self.manager)
         known_fusions: int = len(self.manager.get_known_fusions())
         return [["known", known_fusions], ["unknown", all_fusions - known_fusions]]
 
@@ -24,7 +30,7 @@ class CustomModule(BaseModule):
         counts: Dict[str, int] = dict.fromkeys(running_tools, 0)
         counts["together"] = 0
         running_tools_count: int = len(running_tools)
-        for fusion in self.manager.fusions:
+        for fusion in self.manager.iter_fusions():
             fusion_tools = fusion.tools.keys()
             for tool in fusion_tools:
                 counts[tool] += 1
@@ -41,7 +47,7 @@ class CustomModule(BaseModule):
             Distribution of detection per tool i.e: ['0 tools': 15, '1 tool': 10, '2 tools': 4, ...]
         """
         counts = [0] * (len(self.manager.running_tools) + 1)
-        for fusion in self.manager.fusions:
+        for fusion in self.manager.iter_fusions():
             counts[len(fusion.tools.keys())] += 1
 
         return [[f"{index} tool/s", counts[index]] for index in range(len(counts))]
@@ -51,51 +57,130 @@ class CustomModule(BaseModule):
 
         Returns:
             Dictionary of:
-            rows: each row contains fusion information
+            rows: rows of the fusion table in columns, see `encode_fusions_table`
             tools: list of executed fusion detection tools
         """
-        rows = []
-        tools = self.manager.running_tools
-        filter_flag = len(tools) < self.params["tool_cutoff"]
-        for fusion in self.manager.fusions:
-            row: Dict[str, Any] = {}
+        tools = sorted(self.manager.running_tools)
+        return {"rows": self.encode_fusions_table(self.iter_fusions_table(), tools), "tools": tools}
+
+    def iter_fusions_table(self) -> Iterator[Fusion]:
+        """Yields fusions of the fusion table."""
+        filter_flag = len(self.manager.running_tools) < self.params["tool_cutoff"]
+        for fusion in self.manager.iter_fusions():
             # If number of executed fusion detection tools is lower than cutoff, filter is ignored
-            if filter_flag:
-                row = {
-                    "fusion": fusion.name,
-                    "found_db": fusion.dbs,
-                    "tools_hits": len(fusion.tools),
-                    "score": f"{fusion.score:.3}",
-                }
             # Add only fusions that are detected by at least <cutoff>
             # default = TOOL_DETECTION_CUTOFF
-            if not filter_flag and len(fusion.tools) >= self.params["tool_cutoff"]:
-                row = {
-                    "fusion": fusion.name,
-                    "found_db": fusion.dbs,
-                    "tools_hits": len(fusion.tools),
-                    "score": f"{fusion.score:.3}",
-                }
-
-            # Add only if row is not empty
-            if bool(row):
-                for tool in tools:
-                    row[tool] = "true" if tool in sorted(fusion.tools) else "false"
+            if filter_flag or len(fusion.tools) >= self.params["tool_cutoff"]:
+                yield fusion
+
+    @staticmethod
+    def encode_fusions_table(fusions: Iterable[Fusion], tools: List[str]) -> Dict[str, Any]:
+        """Encodes rows of the fusion table in columns instead of repeating keys in every row.
+        Database names are dictionary encoded, tools which found the fusion are a bitmask of
+        positions in `tools`. Rows are decoded by `decodeFusionTable` in main.js.
+
+        Returns:
+            Dictionary of:
+            fusion: fusion names
+            found_db: indexes of databases of each fusion
+            tools_mask: bitmask of tools of each fusion
+            score: Fusion Indication Index of each fusion
+            databases: database names
+        """
+        databases: Dict[str, int] = {}
+        bits: Dict[str, int] = {tool: 1 << index for index, tool in enumerate(tools)}
+        table: Dict[str, List[Any]] = {"fusion": [], "found_db": [], "tools_mask": [], "score": []}
+        for fusion in fusions:
+            table["fusion"].append(fusion.name)
+            table["found_db"].append(
+                [databases.setdefault(db_name, len(databases)) for db_name in fusion.dbs]
+            )
+            table["tools_mask"].append(sum(bits[tool] for tool in fusion.tools if tool in bits))
+            table["score"].append(f"{fusion.score:.3}")
+
+        return {**table, "databases": list(databases)}
+
+    @staticmethod
+    def encode_graph(graph: List[List[Any]]) -> Dict[str, List[Any]]:
+        """Encodes graph data in columns, decoded by `decodeGraph` in main.js."""
+        return {"labels": [label for label, _ in graph], "values": [value for _, value in graph]}
+
+    def write_fusions_table(self, path: str, shard_size: int) -> Dict[str, Any]:
+        """Writes rows of the fusion table in shards of `shard_size` rows to
+        `Settings.TABLE_SHARDS` in a single pass, so only one shard is held in memory. Each
+        shard is a script passing its rows to `fusionTableShard`, the dashboard loads them
+        one after another, also from local files.
+
+        Returns:
+            Dictionary of:
+            rows: empty, rows are loaded from the shards
+            tools: list of executed fusion detection tools
+            shards: shard files relative to the report
+
+        Raises:
+            ModuleException
+        """
+        shard_dir = os.path.join(path, Settings.TABLE_SHARDS)
+        tools = sorted(self.manager.running_tools)
+        shards: List[str] = []
+        rows: List[Fusion] = []
+
+        def flush() -> None:
+            shard = f"{Settings.TABLE_SHARDS}/{len(shards):05d}.js"
+            with open(os.path.join(path, shard), "w", encoding="utf-8") as output:
+                output.write(f"fusionTableShard({len(shards)}, ")
+                output.write(
+                    json.dumps(self.encode_fusions_table(rows, tools), separators=(",", ":"))
+                )
+                output.write(");\n")
+            shards.append(shard)
+            rows.clear()
+
+        try:
+            os.makedirs(shard_dir, exist_ok=True)
+            # shards of a previous report
+            for shard in glob.glob(os.path.join(shard_dir, "*.js")):
+                os.remove(shard)
+            for row in self.iter_fusions_table():
                 rows.append(row)
+                if len(rows) >= shard_size:
+                    flush()
+            if rows:
+                flush()
+        except IOError as ex:
+            raise ModuleException(ex) from ex
 
-        return {"rows": rows, "tools": list(sorted(tools))}
+        return {"rows": self.encode_fusions_table([], tools), "tools": tools, "shards": shards}
 
     def load(self) -> Dict[str, Any]:
         """Return module variables."""
 
         return {
             "tools": self.manager.running_tools,
-            "num_detected_fusions": len(self.manager.fusions),
+            "num_detected_fusions": len(self.manager),
             "num_known_fusions": len(self.manager.get_known_fusions()),
-            "tool_detection_graph": self.tool_detection(),
-            "known_vs_unknown_graph": self.known_vs_unknown(),
-            "distribution_graph": self.detection_distribution(),
-            "fusion_list": self.create_fusions_table(),
+            "tool_detection_graph": self.encode_graph(self.tool_detection()),
+            "known_vs_unknown_graph": self.encode_graph(self.known_vs_unknown()),
+            "distribution_graph": self.encode_graph(self.detection_distribution()),
+            "fusion_list": (
+                self.write_fusions_table(self.params["output"], self.params["table_shard_size"])
+                if self.params.get("table_shard_size", 0) > 0
+                else self.create_fusions_table()
+            ),
             "tool_cutoff": self.params["tool_cutoff"],
+            "report_layout": self.params.get("report_layout", "pages"),
             "menu": ["Dashboard fusion summary", "List of detected fusions"],
+            "libraries": {
+                "css": ["assets/css/tabulator_bootstrap4.min.css"],
+                "js": [
+                    "assets/js/tabulator.min.js",
+                    "assets/js/xlsx.core-0.20.2.min.js",
+                    "assets/js/jspdf-1.5.3.min.js",
+                    "assets/js/jspdf.plugin.autotable-3.0.10.min.js",
+                    "assets/js/highcharts-7.0.1.js",
+                    "assets/js/highcharts-exporting.js",
+                    "assets/js/highcharts-export-data.js",
+                    "assets/js/colorbrewer-1.3.0.min.js",
+                ],
+            },
         }
@@ -0,0 +1,39 @@
+"""Optimize module"""
+
+import os
+from argparse import Namespace
+
+from fusion_report.common.logger import Logger
+from fusion_report.data.annotations import AnnotationsDB
+from fusion_report.data.breakpoint_index import BreakpointIndex
+from fusion_report.data.fusion_index import FusionIndex
+
+
+class Optimize:
+    """Class designed for optimizing downloaded databases. Databases built by older versions
+    get normalized fusion pair columns and their indexes, statistics of the query planner
+    are updated and database files rebuilt. Indexes of known fusions and breakpoints and
+    consolidated annotations database are rebuilt afterwards.
+    """
+
+    def __init__(self, params: Namespace):
+        self.optimize_all(params.db_path)
+
+    @staticmethod
+    def optimize_all(path: str) -> None:
+        """Optimize all databases found in the path.
+
+        Raises:
+            DbException
+        """
+        for db_class, settings in FusionIndex.DATABASES:
+            if not os.path.exists(os.path.join(path, f'{settings["NAME"].lower()}.db')):
+                continue
+            Logger(__name__).info("Optimizing %s", settings["NAME"])
+            db_class(path).optimize()
+
+        FusionIndex.build(path)
+        BreakpointIndex.build(path)
+        if os.path.exists(os.path.join(path, AnnotationsDB.file_name())):
+            AnnotationsDB(path).build(path)
+        Logger(__name__).info("Optimizing finished")
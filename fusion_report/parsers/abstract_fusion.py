@@ -1,15 +1,52 @@
 """Abstract Fusion module"""
 
 import abc
-from typing import Any, Dict, List, Tuple
+from typing import Any, Callable, Dict, List, Tuple
+
+from fusion_report.common.exceptions.parser import ParserException
 
 
 class AbstractFusionTool(metaclass=abc.ABCMeta):
-    """Abstract class requiring to implement parse method for every fusion detection tool parser."""
+    """Abstract class requiring to implement parse method for every fusion detection tool parser.
+
+    Every parser declares the columns it reads in `columns`, mapping a header name to a converter
+    applied to the raw value. Column positions are resolved once per file in `set_header`, so
+    parsing a line is a positional lookup instead of a header search per field.
+
+    Attributes:
+        columns: Header columns required by the parser and their type converters
+        delimiter: Default column separator of the tool output
+        header: Parsed header of the current file
+    """
+
+    columns: Dict[str, Callable[[str], Any]] = {}
+    delimiter: str = "\t"
 
-    @abc.abstractmethod
     def set_header(self, header: str, delimiter: str | None = None) -> None:
-        """Set header."""
+        """Set header and compile column extractor.
+
+        Raises:
+            ParserException
+        """
+        self.header: List[str] = header.strip().split(delimiter or self.delimiter)
+        positions: Dict[str, int] = {}
+        for index, name in enumerate(self.header):
+            positions.setdefault(name.strip(), index)
+
+        missing: List[str] = [name for name in self.columns if name not in positions]
+        if missing:
+            raise ParserException(
+                f"{self.__class__.__name__} output is missing columns: {', '.join(missing)}"
+            )
+
+        self._extractors: List[Tuple[int, Callable[[str], Any]]] = [
+            (positions[name], converter) for name, converter in self.columns.items()
+        ]
+
+    def extract(self, line: str, delimiter: str | None = None) -> List[Any]:
+        """Returns converted values of declared columns, in the order of `columns`."""
+        col: List[str] = line.split(delimiter or self.delimiter)
+        return [converter(col[index]) for index, converter in self._extractors]
 
     @abc.abstractmethod
     def parse(self, line: str, delimiter: str | None = None) -> List[Tuple[str, Dict[str, Any]]]:
@@ -1,6 +1,6 @@
 """Arriba module"""
 
-from typing import Any, Dict, List, Tuple
+from typing import Any, Callable, Dict, List, Tuple
 
 from fusion_report.parsers.abstract_fusion import AbstractFusionTool
 
@@ -8,8 +8,20 @@ from fusion_report.parsers.abstract_fusion import AbstractFusionTool
 class Arriba(AbstractFusionTool):
     """Arriba tool parser."""
 
-    def set_header(self, header: str, delimiter: str | None = "\t") -> None:
-        self.header: List[str] = header.strip().split(delimiter)
+    columns: Dict[str, Callable[[str], Any]] = {
+        "#gene1": str.strip,
+        "gene2": str.strip,
+        "breakpoint1": str.strip,
+        "breakpoint2": str.strip,
+        "reading_frame": str.strip,
+        "type": str.strip,
+        "split_reads1": str.strip,
+        "split_reads2": str.strip,
+        "discordant_mates": str.strip,
+        "coverage1": str.strip,
+        "coverage2": str.strip,
+        "confidence": str.strip,
+    }
 
     def parse_multiple(self, left_fusion: str, right_fusion: str, delimiter: str) -> List[str]:
         if delimiter not in left_fusion and delimiter not in right_fusion:
@@ -21,26 +33,32 @@ class Arriba(AbstractFusionTool):
 
         return fusions
 
-    def parse(self, line: str, delimiter: str | None = "\t") -> List[Tuple[str, Dict[str, Any]]]:
-        col: List[str] = [x.strip() for x in line.split(delimiter)]
-        fusions = self.parse_multiple(
-            col[self.header.index("#gene1")], col[self.header.index("gene2")], ","
-        )
+    def parse(self, line: str, delimiter: str | None = None) -> List[Tuple[str, Dict[str, Any]]]:
+        (
+            gene1,
+            gene2,
+            breakpoint1,
+            breakpoint2,
+            reading_frame,
+            fusion_type,
+            split_reads1,
+            split_reads2,
+            discordant_mates,
+            coverage1,
+            coverage2,
+            confidence,
+        ) = self.extract(line, delimiter)
+        fusions = self.parse_multiple(gene1, gene2, ",")
         details: Dict[str, Any] = {
-            "position": "#".join(
-                [
-                    col[self.header.index("breakpoint1")],
-                    col[self.header.index("breakpoint2")],
-                ]
-            ),
-            "reading-frame": col[self.header.index("reading_frame")],
-            "type": col[self.header.index("type")],
-            "split_reads1": col[self.header.index("split_reads1")],
-            "split_reads2": col[self.header.index("split_reads2")],
-            "discordant_mates": col[self.header.index("discordant_mates")],
-            "coverage1": col[self.header.index("coverage1")],
-            "coverage2": col[self.header.index("coverage2")],
-            "confidence": col[self.header.index("confidence")],
+            "position": f"{breakpoint1}#{breakpoint2}",
+            "reading-frame": reading_frame,
+            "type": fusion_type,
+            "split_reads1": split_reads1,
+            "split_reads2": split_reads2,
+            "discordant_mates": discordant_mates,
+            "coverage1": coverage1,
+            "coverage2": coverage2,
+            "confidence": confidence,
         }
 
         return [(fusion, details) for fusion in fusions]
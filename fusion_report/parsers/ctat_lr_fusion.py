@@ -1,6 +1,6 @@
 """Star-Fusion Long Reads module."""
 
-from typing import Any, Dict, List, Tuple
+from typing import Any, Callable, Dict, List, Tuple
 
 from fusion_report.parsers.abstract_fusion import AbstractFusionTool
 
@@ -8,21 +8,20 @@ from fusion_report.parsers.abstract_fusion import AbstractFusionTool
 class Ctat_lr_fusion(AbstractFusionTool):
     """Star-Fusion Long Reads (Nanopore or PacBio) tool parser."""
 
-    def set_header(self, header: str, delimiter: str | None = "\t") -> None:
-        self.header: List[str] = header.strip().split(delimiter)
+    columns: Dict[str, Callable[[str], Any]] = {
+        "#FusionName": str.strip,
+        "LeftBreakpoint": str.strip,
+        "RightBreakpoint": str.strip,
+        "num_LR": int,
+        "LR_FFPM": float,
+    }
 
-    def parse(self, line: str, delimiter: str | None = "\t") -> List[Tuple[str, Dict[str, Any]]]:
-        col: List[str] = [x.strip() for x in line.split(delimiter)]
-        fusion: str = f"{col[self.header.index('#FusionName')]}"
+    def parse(self, line: str, delimiter: str | None = None) -> List[Tuple[str, Dict[str, Any]]]:
+        fusion, left_breakpoint, right_breakpoint, num_lr, ffpm = self.extract(line, delimiter)
         details: Dict[str, Any] = {
-            "position": "#".join(
-                [
-                    col[self.header.index("LeftBreakpoint")],
-                    col[self.header.index("RightBreakpoint")],
-                ]
-            ),
-            "num_LR": int(col[self.header.index("num_LR")]),
-            "ffmp": float(col[self.header.index("LR_FFPM")]),
+            "position": f"{left_breakpoint}#{right_breakpoint}",
+            "num_LR": num_lr,
+            "ffmp": ffpm,
         }
 
         return [(fusion, details)]
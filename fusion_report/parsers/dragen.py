@@ -1,6 +1,6 @@
 """Dragen module"""
 
-from typing import Any, Dict, List, Tuple
+from typing import Any, Callable, Dict, List, Tuple
 
 from fusion_report.parsers.abstract_fusion import AbstractFusionTool
 
@@ -8,20 +8,18 @@ from fusion_report.parsers.abstract_fusion import AbstractFusionTool
 class Dragen(AbstractFusionTool):
     """Dragen tool parser."""
 
-    def set_header(self, header: str, delimiter: str | None = "\t") -> None:
-        self.header: List[str] = header.strip().split(delimiter)
+    columns: Dict[str, Callable[[str], Any]] = {
+        "#FusionGene": str.strip,
+        "LeftBreakpoint": str.strip,
+        "RightBreakpoint": str.strip,
+        "Score": int,
+    }
 
-    def parse(self, line: str, delimiter: str | None = "\t") -> List[Tuple[str, Dict[str, Any]]]:
-        col: List[str] = [x.strip() for x in line.split(delimiter)]
-        fusion: str = col[self.header.index("#FusionGene")]
+    def parse(self, line: str, delimiter: str | None = None) -> List[Tuple[str, Dict[str, Any]]]:
+        fusion, left_breakpoint, right_breakpoint, score = self.extract(line, delimiter)
         details: Dict[str, Any] = {
-            "position": "#".join(
-                [
-                    col[self.header.index("LeftBreakpoint")],
-                    col[self.header.index("RightBreakpoint")],
-                ]
-            ).replace("chr", ""),
-            "score": int(col[self.header.index("Score")]),
+            "position": f"{left_breakpoint}#{right_breakpoint}".replace("chr", ""),
+            "score": score,
         }
 
         return [(fusion, details)]
@@ -1,6 +1,6 @@
 """EricScript module"""
 
-from typing import Any, Dict, List, Tuple
+from typing import Any, Callable, Dict, List, Tuple
 
 from fusion_report.parsers.abstract_fusion import AbstractFusionTool
 
@@ -8,26 +8,48 @@ from fusion_report.parsers.abstract_fusion import AbstractFusionTool
 class Ericscript(AbstractFusionTool):
     """EricScript tool parser."""
 
-    def set_header(self, header: str, delimiter: str | None = "\t") -> None:
-        self.header: List[str] = header.strip().split(delimiter)
+    columns: Dict[str, Callable[[str], Any]] = {
+        "GeneName1": str.strip,
+        "GeneName2": str.strip,
+        "chr1": str.strip,
+        "Breakpoint1": str.strip,
+        "strand1": str.strip,
+        "chr2": str.strip,
+        "Breakpoint2": str.strip,
+        "strand2": str.strip,
+        "crossingreads": int,
+        "spanningreads": int,
+        "fusiontype": str.strip,
+        "GeneExpr1": float,
+        "GeneExpr2": float,
+        "GeneExpr_Fused": float,
+    }
 
-    def parse(self, line: str, delimiter: str | None = "\t") -> List[Tuple[str, Dict[str, Any]]]:
-        col: List[str] = [x.strip() for x in line.split(delimiter)]
-        fusion: str = "--".join(
-            [col[self.header.index("GeneName1")], col[self.header.index("GeneName2")]]
-        )
+    def parse(self, line: str, delimiter: str | None = None) -> List[Tuple[str, Dict[str, Any]]]:
+        (
+            gene1,
+            gene2,
+            chr1,
+            breakpoint1,
+            strand1,
+            chr2,
+            breakpoint2,
+            strand2,
+            crossing_reads,
+            spanning_reads,
+            fusion_type,
+            gene_expr1,
+            gene_expr2,
+            gene_expr_fused,
+        ) = self.extract(line, delimiter)
         details: Dict[str, Any] = {
-            "position": (
-                f"{col[self.header.index('chr1')]}:{col[self.header.index('Breakpoint1')]}:"
-                f"{col[self.header.index('strand1')]}#{col[self.header.index('chr2')]}:"
-                f"{col[self.header.index('Breakpoint2')]}:{col[self.header.index('strand2')]}"
-            ),
-            "discordant_reads": int(col[self.header.index("crossingreads")]),
-            "junction_reads": int(col[self.header.index("spanningreads")]),
-            "fusion_type": col[self.header.index("fusiontype")],
-            "gene_expr1": float(col[self.header.index("GeneExpr1")]),
-            "gene_expr2": float(col[self.header.index("GeneExpr2")]),
-            "gene_expr_fusion": float(col[self.header.index("GeneExpr_Fused")]),
+            "position": f"{chr1}:{breakpoint1}:{strand1}#{chr2}:{breakpoint2}:{strand2}",
+            "discordant_reads": crossing_reads,
+            "junction_reads": spanning_reads,
+            "fusion_type": fusion_type,
+            "gene_expr1": gene_expr1,
+            "gene_expr2": gene_expr2,
+            "gene_expr_fusion": gene_expr_fused,
         }
 
-        return [(fusion, details)]
+        return [(f"{gene1}--{gene2}", details)]
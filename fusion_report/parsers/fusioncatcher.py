@@ -1,6 +1,6 @@
 """FusionCatcher module"""
 
-from typing import Any, Dict, List, Tuple
+from typing import Any, Callable, Dict, List, Tuple
 
 from fusion_report.parsers.abstract_fusion import AbstractFusionTool
 
@@ -8,29 +8,37 @@ from fusion_report.parsers.abstract_fusion import AbstractFusionTool
 class Fusioncatcher(AbstractFusionTool):
     """FusionCatcher tool parser."""
 
-    def set_header(self, header: str, delimiter: str | None = "\t") -> None:
-        self.header: List[str] = header.strip().split(delimiter)
+    columns: Dict[str, Callable[[str], Any]] = {
+        "Gene_1_symbol(5end_fusion_partner)": str.strip,
+        "Gene_2_symbol(3end_fusion_partner)": str.strip,
+        "Fusion_point_for_gene_1(5end_fusion_partner)": str.strip,
+        "Fusion_point_for_gene_2(3end_fusion_partner)": str.strip,
+        "Counts_of_common_mapping_reads": int,
+        "Spanning_pairs": int,
+        "Spanning_unique_reads": int,
+        "Longest_anchor_found": int,
+        "Predicted_effect": str.strip,
+    }
 
-    def parse(self, line: str, delimiter: str | None = "\t") -> List[Tuple[str, Dict[str, Any]]]:
-        col: List[str] = [x.strip() for x in line.split(delimiter)]
-        fusion: str = "--".join(
-            [
-                col[self.header.index("Gene_1_symbol(5end_fusion_partner)")],
-                col[self.header.index("Gene_2_symbol(3end_fusion_partner)")],
-            ]
-        )
+    def parse(self, line: str, delimiter: str | None = None) -> List[Tuple[str, Dict[str, Any]]]:
+        (
+            gene1,
+            gene2,
+            fusion_point1,
+            fusion_point2,
+            common_mapping_reads,
+            spanning_pairs,
+            spanning_unique_reads,
+            longest_anchor,
+            predicted_effect,
+        ) = self.extract(line, delimiter)
         details: Dict[str, Any] = {
-            "position": "#".join(
-                [
-                    col[self.header.index("Fusion_point_for_gene_1(5end_fusion_partner)")],
-                    col[self.header.index("Fusion_point_for_gene_2(3end_fusion_partner)")],
-                ]
-            ),
-            "common_mapping_reads": int(col[self.header.index("Counts_of_common_mapping_reads")]),
-            "spanning_pairs": int(col[self.header.index("Spanning_pairs")]),
-            "spanning_unique_reads": int(col[self.header.index("Spanning_unique_reads")]),
-            "longest_anchor": int(col[self.header.index("Longest_anchor_found")]),
-            "fusion_type": col[self.header.index("Predicted_effect")].strip(),
+            "position": f"{fusion_point1}#{fusion_point2}",
+            "common_mapping_reads": common_mapping_reads,
+            "spanning_pairs": spanning_pairs,
+            "spanning_unique_reads": spanning_unique_reads,
+            "longest_anchor": longest_anchor,
+            "fusion_type": predicted_effect,
         }
 
-        return [(fusion, details)]
+        return [(f"{gene1}--{gene2}", details)]
@@ -1,6 +1,6 @@
 """Jaffa module"""
 
-from typing import Any, Dict, List, Tuple
+from typing import Any, Callable, Dict, List, Tuple
 
 from fusion_report.parsers.abstract_fusion import AbstractFusionTool
 
@@ -8,41 +8,59 @@ from fusion_report.parsers.abstract_fusion import AbstractFusionTool
 class Jaffa(AbstractFusionTool):
     """Jaffa tool parser."""
 
-    def set_header(self, header: str, delimiter: str | None = ",") -> None:
-        self.header: List[str] = header.strip().split(delimiter)
+    columns: Dict[str, Callable[[str], Any]] = {
+        "fusion genes": str.strip,
+        "chrom1": str.strip,
+        "base1": str.strip,
+        "strand1": str.strip,
+        "chrom2": str.strip,
+        "base2": str.strip,
+        "strand2": str.strip,
+        "spanning pairs": int,
+        "spanning reads": int,
+        "inframe": str.strip,
+        "aligns": str.strip,
+        "rearrangement": str.strip,
+        "classification": str.strip,
+        "known": str.strip,
+    }
+    delimiter: str = ","
 
-    def parse(self, line: str, delimiter: str | None = ",") -> List[Tuple[str, Dict[str, Any]]]:
-        col: List[str] = [x.strip() for x in line.split(delimiter)]
+    def parse(self, line: str, delimiter: str | None = None) -> List[Tuple[str, Dict[str, Any]]]:
+        (
+            fusion_genes,
+            chrom1,
+            base1,
+            strand1,
+            chrom2,
+            base2,
+            strand2,
+            spanning_pairs,
+            spanning_reads,
+            inframe,
+            aligns,
+            rearrangement,
+            classification,
+            known,
+        ) = self.extract(line, delimiter)
 
-        fusions = col[self.header.index("fusion genes")].split(":")
+        fusions = fusion_genes.split(":")
         fusion: str = "--".join([fusions[0], fusions[1]])
 
         details: Dict[str, Any] = {
             "position": "#".join(
                 [
-                    ":".join(
-                        [
-                            col[self.header.index("chrom1")],
-                            col[self.header.index("base1")],
-                            col[self.header.index("strand1")],
-                        ]
-                    ).replace("chr", ""),
-                    ":".join(
-                        [
-                            col[self.header.index("chrom2")],
-                            col[self.header.index("base2")],
-                            col[self.header.index("strand2")],
-                        ]
-                    ).replace("chr", ""),
+                    f"{chrom1}:{base1}:{strand1}".replace("chr", ""),
+                    f"{chrom2}:{base2}:{strand2}".replace("chr", ""),
                 ]
             ),
-            "spanning_pairs": int(col[self.header.index("spanning pairs")]),
-            "spanning_reads": int(col[self.header.index("spanning reads")]),
-            "inframe": col[self.header.index("inframe")].strip(),
-            "aligns": col[self.header.index("aligns")].strip(),
-            "rearrangement": col[self.header.index("rearrangement")].strip(),
-            "classification": col[self.header.index("classification")].strip(),
-            "known": col[self.header.index("known")].strip(),
+            "spanning_pairs": spanning_pairs,
+            "spanning_reads": spanning_reads,
+            "inframe": inframe,
+            "aligns": aligns,
+            "rearrangement": rearrangement,
+            "classification": classification,
+            "known": known,
         }
 
         return [(fusion, details)]
@@ -1,6 +1,6 @@
 """Pizzly module"""
 
-from typing import Any, Dict, List, Tuple
+from typing import Any, Callable, Dict, List, Tuple
 
 from fusion_report.parsers.abstract_fusion import AbstractFusionTool
 
@@ -8,17 +8,18 @@ from fusion_report.parsers.abstract_fusion import AbstractFusionTool
 class Pizzly(AbstractFusionTool):
     """Pizzly tool parser."""
 
-    def set_header(self, header: str, delimiter: str | None = "\t") -> None:
-        self.header: List[str] = header.strip().split(delimiter)
+    columns: Dict[str, Callable[[str], Any]] = {
+        "geneA.name": str.strip,
+        "geneB.name": str.strip,
+        "paircount": int,
+        "splitcount": int,
+    }
 
-    def parse(self, line: str, delimiter: str | None = "\t") -> List[Tuple[str, Dict[str, Any]]]:
-        col: List[str] = [x.strip() for x in line.split(delimiter)]
-        fusion: str = "--".join(
-            [col[self.header.index("geneA.name")], col[self.header.index("geneB.name")]]
-        )
+    def parse(self, line: str, delimiter: str | None = None) -> List[Tuple[str, Dict[str, Any]]]:
+        gene_a, gene_b, pair_count, split_count = self.extract(line, delimiter)
         details: Dict[str, Any] = {
-            "pair_count": int(col[self.header.index("paircount")]),
-            "split_count": int(col[self.header.index("splitcount")]),
+            "pair_count": pair_count,
+            "split_count": split_count,
         }
 
-        return [(fusion, details)]
+        return [(f"{gene_a}--{gene_b}", details)]
@@ -1,6 +1,6 @@
 """Squid module"""
 
-from typing import Any, Dict, List, Tuple
+from typing import Any, Callable, Dict, List, Tuple
 
 from fusion_report.parsers.abstract_fusion import AbstractFusionTool
 
@@ -8,35 +8,50 @@ from fusion_report.parsers.abstract_fusion import AbstractFusionTool
 class Squid(AbstractFusionTool):
     """Squid tool parser."""
 
-    def set_header(self, header: str, delimiter: str | None = "\t") -> None:
-        self.header: List[str] = header.strip().split(delimiter)
+    columns: Dict[str, Callable[[str], Any]] = {
+        "Type": str.strip,
+        "FusedGenes": str.strip,
+        "# chrom1": str.strip,
+        "start1": str.strip,
+        "end1": str.strip,
+        "strand1": str.strip,
+        "chrom2": str.strip,
+        "start2": str.strip,
+        "end2": str.strip,
+        "strand2": str.strip,
+        "score": int,
+    }
 
     def parse_multiple(self, col: str, delimiter: str) -> List[str]:
         return [fusion.replace(":", "--") for fusion in col.split(delimiter)]
 
-    def parse(self, line: str, delimiter: str | None = "\t") -> List[Tuple[str, Dict[str, Any]]]:
-        col: List[str] = [x.strip() for x in line.split(delimiter)]
-        if col[self.header.index("Type")].strip() == "non-fusion-gene":
+    def parse(self, line: str, delimiter: str | None = None) -> List[Tuple[str, Dict[str, Any]]]:
+        (
+            fusion_kind,
+            fused_genes,
+            chrom1,
+            start1,
+            end1,
+            strand1,
+            chrom2,
+            start2,
+            end2,
+            strand2,
+            score,
+        ) = self.extract(line, delimiter)
+        if fusion_kind == "non-fusion-gene":
             return [("", {})]
 
-        fusions = self.parse_multiple(col[self.header.index("FusedGenes")], ",")
-        left_breakpoint: str = (
-            f"{col[self.header.index('# chrom1')]}:{col[self.header.index('start1')]}"
-            "-"
-            f"{col[self.header.index('end1')]}:{col[self.header.index('strand1')]}"
-        ).replace("chr", "")
-        right_breakpoint: str = (
-            f"{col[self.header.index('chrom2')]}:{col[self.header.index('start2')]}"
-            "-"
-            f"{col[self.header.index('end2')]}:{col[self.header.index('strand2')]}"
-        ).replace("chr", "")
+        fusions = self.parse_multiple(fused_genes, ",")
+        left_breakpoint: str = f"{chrom1}:{start1}-{end1}:{strand1}".replace("chr", "")
+        right_breakpoint: str = f"{chrom2}:{start2}-{end2}:{strand2}".replace("chr", "")
         details: Dict[str, Any] = {
             "position": (
                 f"{left_breakpoint}#{right_breakpoint}"
-                if col[self.header.index("strand1")] == "+"
+                if strand1 == "+"
                 else f"{right_breakpoint}#{left_breakpoint}"
             ),
-            "score": int(col[self.header.index("score")]),
+            "score": score,
         }
 
         return [(fusion, details) for fusion in fusions]
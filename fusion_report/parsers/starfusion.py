@@ -1,6 +1,6 @@
 """Star-Fusion module."""
 
-from typing import Any, Dict, List, Tuple
+from typing import Any, Callable, Dict, List, Tuple
 
 from fusion_report.parsers.abstract_fusion import AbstractFusionTool
 
@@ -8,22 +8,29 @@ from fusion_report.parsers.abstract_fusion import AbstractFusionTool
 class Starfusion(AbstractFusionTool):
     """Star-Fusion tool parser."""
 
-    def set_header(self, header: str, delimiter: str | None = "\t") -> None:
-        self.header: List[str] = header.strip().split(delimiter)
+    columns: Dict[str, Callable[[str], Any]] = {
+        "#FusionName": str.strip,
+        "LeftBreakpoint": str.strip,
+        "RightBreakpoint": str.strip,
+        "JunctionReadCount": int,
+        "SpanningFragCount": int,
+        "FFPM": float,
+    }
 
-    def parse(self, line: str, delimiter: str | None = "\t") -> List[Tuple[str, Dict[str, Any]]]:
-        col: List[str] = [x.strip() for x in line.split(delimiter)]
-        fusion: str = f"{col[self.header.index('#FusionName')]}"
+    def parse(self, line: str, delimiter: str | None = None) -> List[Tuple[str, Dict[str, Any]]]:
+        (
+            fusion,
+            left_breakpoint,
+            right_breakpoint,
+            junction_reads,
+            spanning_reads,
+            ffpm,
+        ) = self.extract(line, delimiter)
         details: Dict[str, Any] = {
-            "position": "#".join(
-                [
-                    col[self.header.index("LeftBreakpoint")],
-                    col[self.header.index("RightBreakpoint")],
-                ]
-            ),
-            "junction_reads": int(col[self.header.index("JunctionReadCount")]),
-            "spanning_reads": int(col[self.header.index("SpanningFragCount")]),
-            "ffmp": float(col[self.header.index("FFPM")]),
+            "position": f"{left_breakpoint}#{right_breakpoint}",
+            "junction_reads": junction_reads,
+            "spanning_reads": spanning_reads,
+            "ffmp": ffpm,
         }
 
         return [(fusion, details)]
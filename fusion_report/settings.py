@@ -6,7 +6,24 @@ class Settings:
     ROOT_DIR: str = os.path.dirname(os.path.abspath(__file__))
     DATE_FORMAT: str = "%d/%m/%Y"
     THREAD_NUM: int = 2
+    READ_BUFFER_SIZE: int = 1024 * 1024
+    IMPORT_BATCH_SIZE: int = 10000
+    # KiB
+    IMPORT_CACHE_SIZE: int = 64 * 1024
+    DB_MMAP_SIZE: int = 1024 * 1024 * 1024
+    ANNOTATION_BATCH_SIZE: int = 500
+    ANNOTATION_CACHE_SIZE: int = 100000
     VERSION: str = "4.0.1"
+    FUSION_INDEX: str = "fusions.idx"
+    BREAKPOINT_INDEX: str = "breakpoints.idx"
+    REPORT_DATA: str = "report_data.js"
+    TABLE_SHARDS: str = "fusion_table"
+    REPORT_MANIFEST: str = "report_manifest.json"
+    REPORT_ARCHIVE: str = "report"
+    CACHE_DIR: str = os.path.join(
+        os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+        "fusion_report",
+    )
     FUSION_WEIGHTS: Dict[str, float] = {
         "cosmic": 0.50,
         "mitelman": 0.50,
@@ -28,6 +45,11 @@ class Settings:
         "FILE": "FusionGDB2_id.xlsx",
     }
 
+    ANNOTATIONS: Dict[str, str] = {
+        "NAME": "Annotations",
+        "SCHEMA": "Annotations.sql",
+    }
+
     MITELMAN: Dict[str, str] = {
         "NAME": "Mitelman",
         "SCHEMA": "Mitelman.sql",
@@ -9,6 +9,9 @@ from typing import List
 from fusion_report.common.exceptions.download import DownloadException
 from fusion_report.common.logger import Logger
 from fusion_report.common.net import Net
+from fusion_report.data.annotations import AnnotationsDB
+from fusion_report.data.breakpoint_index import BreakpointIndex
+from fusion_report.data.fusion_index import FusionIndex
 from fusion_report.settings import Settings
 
 
@@ -56,3 +59,11 @@ class Sync:
         time.sleep(1)
         Logger(__name__).info("Cleaning up the mess")
         Net.clean()
+
+        # Index of known fusions used by the run, next to the databases
+        FusionIndex.build(".")
+        BreakpointIndex.build(".")
+
+        # consolidated database is kept up to date when it was built before
+        if os.path.exists(AnnotationsDB.file_name()):
+            AnnotationsDB(".").build(".")
@@ -74,6 +74,30 @@ let linkFormatter = function(cell, formatterParams) {
     return `<a href="${formatterParams.url}/${value}" target="${target}" data-toggle="tooltip" data-placement="top" title="${formatterParams.title}">${value}</a>`;
 };
 
+// Columnar payloads
+function decodeFusionTable(columns, tools) {
+    let rows = [];
+    columns.fusion.forEach(function(fusion, index) {
+        let row = {
+            fusion: fusion,
+            found_db: columns.found_db[index].map(db => columns.databases[db]),
+            tools_hits: 0,
+            score: columns.score[index]
+        };
+        tools.forEach(function(tool, bit) {
+            let found = (columns.tools_mask[index] >> bit) & 1;
+            row.tools_hits += found;
+            row[tool] = found ? "true" : "false";
+        });
+        rows.push(row);
+    });
+    return rows;
+}
+
+function decodeGraph(columns) {
+    return columns.labels.map((label, index) => [label, columns.values[index]]);
+}
+
 // Table function buttons
 function copyTable(name) {
     let table = getTable(name);